@@ -28,6 +28,12 @@ def format_temp(temp):
 hyperl15_font = bitmap_font.load_font("fonts/hyperl15reg.pcf")
 terminal_font = terminalio.FONT
 
+# Shared single-colour backgrounds for the pop % labels; the palette never
+# changes and bitmaps only vary by text width, so reuse them across cells
+_pop_bg_palette = displayio.Palette(1)
+_pop_bg_palette[0] = WHITE
+_pop_bg_bitmaps = {}
+
 
 def get_cell_display_text(forecast_item):
     """Get display text for a forecast cell - timestamps are already in local time"""
@@ -119,9 +125,10 @@ def create_forecast_row(forecast_data, y_position=50, icon_loader=None):
 
             # Create black background for pop text
             pop_text_width = len(pop_text) * 6
-            pop_bg_bitmap = displayio.Bitmap(pop_text_width + 3, 9, 1)
-            pop_bg_palette = displayio.Palette(1)
-            pop_bg_palette[0] = WHITE
+            pop_bg_bitmap = _pop_bg_bitmaps.get(pop_text_width)
+            if pop_bg_bitmap is None:
+                pop_bg_bitmap = displayio.Bitmap(pop_text_width + 3, 9, 1)
+                _pop_bg_bitmaps[pop_text_width] = pop_bg_bitmap
 
             # Position at bottom right of icon (icon is 32x32, starts at icon_x, icon_y)
             icon_x = cell_x + (cell_width - 32) // 2 - 9
@@ -133,7 +140,7 @@ def create_forecast_row(forecast_data, y_position=50, icon_loader=None):
 
             pop_bg_grid = displayio.TileGrid(
                 pop_bg_bitmap,
-                pixel_shader=pop_bg_palette,
+                pixel_shader=_pop_bg_palette,
                 x=pop_bg_x,
                 y=pop_bg_y,
             )
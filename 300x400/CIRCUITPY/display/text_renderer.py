@@ -17,25 +17,67 @@ BLACK = 0x000000
 WHITE = 0xFFFFFF
 RED = 0xFF0000
 
+# Max measured widths kept (cleared when full to bound memory)
+WIDTH_CACHE_SIZE = 256
+
+# Measured pixel widths keyed by (text, font), shared by every renderer so a
+# new renderer doesn't build Labels to re-measure the same words
+_width_cache = {}
+
+# (char_width, char_height, avg_char_width) per regular font, measured once
+_font_metrics = {}
+
+# Blank white background bitmaps keyed by (width, height), and their palette;
+# never drawn into, so every render can share them
+_background_bitmaps = {}
+_background_palette = None
+
+# Markup tag -> text style (<red> changes color instead)
+_TAG_STYLES = {
+    "b": "bold",
+    "i": "italic",
+    "bi": "bold_italic",
+    "h": "header",
+    "hb": "header_bold",
+}
+
+# Body and header fonts, loaded once and shared by every TextRenderer; a font
+# caches the glyphs it has loaded, so later renders reuse them
+_fonts = None
+
+
+def _load_fonts():
+    """Load (regular, bold, italic, bold_italic, header, header_bold) fonts once"""
+    global _fonts
+    if _fonts is None:
+        _fonts = (
+            # Vollkorn fonts for body text
+            bitmap_font.load_font("fonts/vollkorn20reg.pcf"),
+            bitmap_font.load_font("fonts/vollkorn20black.pcf"),
+            bitmap_font.load_font("fonts/vollkorn20italic.pcf"),
+            bitmap_font.load_font("fonts/vollkorn20blackitalic.pcf"),
+            # Atkinson Hyperlegible fonts for headers
+            bitmap_font.load_font("fonts/hyperl20reg.pcf"),
+            bitmap_font.load_font("fonts/hyperl20bold.pcf"),
+        )
+    return _fonts
+
 
 class TextRenderer:
     def __init__(self, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
         self.width = width
         self.height = height
 
-        # Load fonts with fallback
+        # Load fonts with fallback (a failed load is retried by the next renderer)
         try:
-            # Vollkorn fonts for body text
-            self.font_regular = bitmap_font.load_font("fonts/vollkorn20reg.pcf")
-            self.font_bold = bitmap_font.load_font("fonts/vollkorn20black.pcf")
-            self.font_italic = bitmap_font.load_font("fonts/vollkorn20italic.pcf")
-            self.font_bold_italic = bitmap_font.load_font(
-                "fonts/vollkorn20blackitalic.pcf"
-            )
-
-            # Atkinson Hyperlegible fonts for headers
-            self.header_font_regular = bitmap_font.load_font("fonts/hyperl20reg.pcf")
-            self.header_font_bold = bitmap_font.load_font("fonts/hyperl20bold.pcf")
+            (
+                self.font_regular,
+                self.font_bold,
+                self.font_italic,
+                self.font_bold_italic,
+                self.header_font_regular,
+                self.header_font_bold,
+            ) = _load_fonts()
         except Exception as e:
             log_error(f"font loading failed: {e}")
             # Fallback to terminal font
@@ -46,40 +88,54 @@ class TextRenderer:
             self.header_font_regular = terminalio.FONT
             self.header_font_bold = terminalio.FONT
 
-        # Get font metrics
-        test_label = label.Label(self.font_regular, text="M", color=BLACK)
-        self.char_width = test_label.bounding_box[2] if test_label.bounding_box else 10
-        self.char_height = test_label.bounding_box[3] if test_label.bounding_box else 16
+        # Style -> font, looked up once per measured/rendered segment
+        self._style_fonts = {
+            "bold": self.font_bold,
+            "italic": self.font_italic,
+            "bold_italic": self.font_bold_italic,
+            "header": self.header_font_regular,
+            "header_bold": self.header_font_bold,
+        }
+
+        # Get font metrics (measured by the first renderer using these fonts)
+        metrics = _font_metrics.get(self.font_regular)
+        if metrics is None:
+            test_label = label.Label(self.font_regular, text="M", color=BLACK)
+            bounding_box = test_label.bounding_box
+            self.char_width = bounding_box[2] if bounding_box else 10
+            self.char_height = bounding_box[3] if bounding_box else 16
+
+            # Average width for capacity estimates (font is not monospaced)
+            avg_char_width = (
+                self.measure_text_width("abcdefghijklmnopqrstuvwxyz", "regular") / 26
+            )
+            metrics = (self.char_width, self.char_height, avg_char_width)
+            _font_metrics[self.font_regular] = metrics
+        self.char_width, self.char_height, avg_char_width = metrics
         self.line_height = int(self.char_height * 1.5)  # 50% spacing between lines
 
         # Calculate approximate capacity (for estimates only, since font is not monospaced)
-        avg_char_width = (
-            self.measure_text_width("abcdefghijklmnopqrstuvwxyz", "regular") / 26
-        )
         self.chars_per_line = int(self.width // avg_char_width)
         self.lines_per_screen = self.height // self.line_height
         self.total_char_capacity = self.chars_per_line * self.lines_per_screen
 
     def get_font_for_style(self, style):
         """Get the appropriate font for a style"""
-        if style == "bold":
-            return self.font_bold
-        elif style == "italic":
-            return self.font_italic
-        elif style == "bold_italic":
-            return self.font_bold_italic
-        elif style == "header":
-            return self.header_font_regular
-        elif style == "header_bold":
-            return self.header_font_bold
-        else:
-            return self.font_regular
+        return self._style_fonts.get(style, self.font_regular)
 
     def measure_text_width(self, text, style):
         """Measure the actual width of text in pixels by rendering it"""
         if not text:
             return 0
+
+        # Building a Label lays out a glyph TileGrid per character just to read
+        # its bounding box; wrapping measures the same words/prefixes repeatedly
         font = self.get_font_for_style(style)
+        key = (text, font)
+        width = _width_cache.get(key)
+        if width is not None:
+            return width
+
         test_label = label.Label(font, text=text, color=BLACK)
         width = (
             test_label.bounding_box[2]
@@ -87,6 +143,9 @@ class TextRenderer:
             else len(text) * self.char_width
         )
 
+        if len(_width_cache) >= WIDTH_CACHE_SIZE:
+            _width_cache.clear()
+        _width_cache[key] = width
         return width
 
     def should_break_word(self, word, remaining_width, style):
@@ -164,17 +223,10 @@ class TextRenderer:
             child_style = current_style
             child_color = current_color
 
-            if child.tag == "b":
-                child_style = "bold"
-            elif child.tag == "i":
-                child_style = "italic"
-            elif child.tag == "bi":
-                child_style = "bold_italic"
-            elif child.tag == "h":
-                child_style = "header"
-            elif child.tag == "hb":
-                child_style = "header_bold"
-            elif child.tag == "red":
+            tag = child.tag
+            if tag in _TAG_STYLES:
+                child_style = _TAG_STYLES[tag]
+            elif tag == "red":
                 child_color = RED
                 # Keep current style but change color
 
@@ -286,6 +338,20 @@ class TextRenderer:
 
         return wrapped_lines
 
+    def _background_bitmap(self):
+        """Get the shared blank background bitmap for this renderer's size"""
+        global _background_palette
+        if _background_palette is None:
+            _background_palette = displayio.Palette(1)
+            _background_palette[0] = WHITE
+
+        size = (self.width, self.height)
+        bitmap = _background_bitmaps.get(size)
+        if bitmap is None:
+            bitmap = displayio.Bitmap(self.width, self.height, 1)
+            _background_bitmaps[size] = bitmap
+        return bitmap
+
     def render_text(self, markup_text):
         """Render marked-up text to a display group"""
         # Parse markup
@@ -298,11 +364,8 @@ class TextRenderer:
         group = displayio.Group()
 
         # Create white background
-        background_bitmap = displayio.Bitmap(self.width, self.height, 1)
-        background_palette = displayio.Palette(1)
-        background_palette[0] = WHITE
         background_sprite = displayio.TileGrid(
-            background_bitmap, pixel_shader=background_palette
+            self._background_bitmap(), pixel_shader=_background_palette
         )
         group.append(background_sprite)
 
@@ -334,6 +397,12 @@ class TextRenderer:
                 if prev_was_hyperlegible and current_is_regular:
                     x_position = max(0, x_position - 8)  # Pull 8 pixels closer
 
+                # Spaces between words draw nothing; just advance past them
+                # (same width as the Label would have, via the shared cache)
+                if text_content == " ":
+                    x_position += self.measure_text_width(text_content, style)
+                    continue
+
                 font = self.get_font_for_style(style)
                 text_label = label.Label(font, text=text_content, color=color)
                 text_label.x = x_position
@@ -5,14 +5,19 @@ Extracted from code.py to be shared between hardware and preview
 
 from utils.logger import log, log_error
 from weather.narrative import get_weather_narrative
+from weather.weather_history import compare_with_yesterday
 
 from display.header import create_weather_layout
 from display.severe_alert import create_alert_overlay
 
 
 # note, preview server will use generate_weather_narrative
-def generate_weather_narrative(weather_data):
-    """Generate rich weather narrative from weather data"""
+def generate_weather_narrative(weather_data, compare_fn=compare_with_yesterday):
+    """Generate rich weather narrative from weather data
+
+    compare_fn optionally overrides the yesterday comparison (see
+    get_weather_narrative) without swapping module globals per call.
+    """
     try:
         # Extract current weather info for narrative generation
         current_weather = {
@@ -34,7 +39,7 @@ def generate_weather_narrative(weather_data):
 
         # Generate the rich narrative
         narrative = get_weather_narrative(
-            current_weather, forecast_data, current_timestamp
+            current_weather, forecast_data, current_timestamp, compare_fn=compare_fn
         )
 
         log(f"Generated weather narrative: {narrative}")
@@ -126,11 +126,8 @@ def get_hour_from_timestamp(timestamp):
     Returns:
         int: Hour in 24-hour format (0-23)
     """
-    # Manual time calculation to avoid datetime timezone issues
-    year, month, day, hour, minute, second, weekday = _timestamp_to_components(
-        timestamp
-    )
-    return hour
+    # Only the time of day is needed, so skip the full date breakdown
+    return int(timestamp % 86400) // 3600
 
 
 def get_day_from_timestamp(timestamp):
@@ -286,14 +283,14 @@ def _timestamp_to_components(timestamp):
     # Start from Unix epoch: January 1, 1970
     year = 1970
 
-    # Handle years
-    while True:
-        days_in_year = 366 if _is_leap_year(year) else 365
-        if days_since_epoch >= days_in_year:
-            days_since_epoch -= days_in_year
-            year += 1
-        else:
-            break
+    # Handle years: estimate from 365-day years, then step back at most a
+    # year or two for the leap days, instead of walking every year since 1970
+    year += days_since_epoch // 365
+    days_before_year = _days_before_year(year)
+    while days_before_year > days_since_epoch:
+        year -= 1
+        days_before_year = _days_before_year(year)
+    days_since_epoch -= days_before_year
 
     # Handle months
     month = 1
@@ -313,6 +310,13 @@ def _timestamp_to_components(timestamp):
     return year, month, day, hour, minute, second, weekday
 
 
+def _days_before_year(year):
+    """Days from Jan 1, 1970 to Jan 1 of year"""
+    y = year - 1
+    leap_days = (y // 4 - y // 100 + y // 400) - 477  # 477 leap years before 1970
+    return (year - 1970) * 365 + leap_days
+
+
 def _is_leap_year(year):
     """Check if year is a leap year"""
     return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
@@ -18,6 +18,9 @@ from weather.narrative.calendar_events import (
 from weather.narrative.content_prioritizer import ContentPrioritizer
 from weather.weather_history import compare_with_yesterday
 
+# Words in the current description that mean it's precipitating now
+_CURRENT_PRECIP_WORDS = ("rain", "snow", "storm", "drizzle", "shower")
+
 
 def format_temp(temp):
     """Format temperature to avoid negative zero"""
@@ -32,7 +35,11 @@ def format_temp(temp):
 
 
 def get_weather_narrative(
-    weather_data, forecast_data, current_timestamp=None, max_length=400
+    weather_data,
+    forecast_data,
+    current_timestamp=None,
+    max_length=400,
+    compare_fn=compare_with_yesterday,
 ):
     """Generate enhanced weather narrative with priority system and improvements
 
@@ -41,6 +48,8 @@ def get_weather_narrative(
         forecast_data: List of forecast items for next ~24 hours
         current_timestamp: Unix timestamp for current time (in local time)
         max_length: Maximum length for the narrative
+        compare_fn: Yesterday comparison callable taking
+            (current_temp, high_temp, low_temp, current_timestamp)
 
     Returns:
         str: Enhanced contextual weather description
@@ -88,7 +97,7 @@ def get_weather_narrative(
     prioritizer.add_item(current_conditions, priority=10, category="current")
 
     # 2. Yesterday comparison (HIGH PRIORITY if significant)
-    yesterday_comparison = compare_with_yesterday(
+    yesterday_comparison = compare_fn(
         current_temp, high_temp, low_temp, current_timestamp
     )
     if yesterday_comparison:
@@ -113,13 +122,9 @@ def get_weather_narrative(
         )
 
     # 4. Upcoming precipitation (MEDIUM-HIGH PRIORITY)
-    current_has_precip = (
-        any(
-            precip in weather_desc.lower()
-            for precip in ["rain", "snow", "storm", "drizzle", "shower"]
-        )
-        if weather_desc
-        else False
+    # weather_desc is already lowercased above
+    current_has_precip = any(
+        precip in weather_desc for precip in _CURRENT_PRECIP_WORDS
     )
 
     # Only add upcoming precipitation if current precipitation didn't already handle timing
@@ -414,16 +419,21 @@ def _describe_tomorrow_outlook(
         temp_desc = f"hi:<h>{format_temp(upcoming_high)}</h>° lo:<h>{format_temp(upcoming_low)}</h>°"
 
     # Analyze upcoming conditions from forecast data with time ranges
+    # (descriptions are lowercased once above and shared by every pass)
     rain_periods = _analyze_weather_periods(
-        upcoming_items, ["rain", "drizzle"], ["09", "10"]
+        upcoming_items, ["rain", "drizzle"], ["09", "10"], upcoming_descriptions
+    )
+    snow_periods = _analyze_weather_periods(
+        upcoming_items, ["snow"], ["13"], upcoming_descriptions
     )
-    snow_periods = _analyze_weather_periods(upcoming_items, ["snow"], ["13"])
     storm_periods = _analyze_weather_periods(
-        upcoming_items, ["storm", "thunder"], ["11"]
+        upcoming_items, ["storm", "thunder"], ["11"], upcoming_descriptions
+    )
+    clear_periods = _analyze_weather_periods(
+        upcoming_items, ["clear"], ["01"], upcoming_descriptions
     )
-    clear_periods = _analyze_weather_periods(upcoming_items, ["clear"], ["01"])
     cloud_periods = _analyze_weather_periods(
-        upcoming_items, ["cloud"], ["02", "03", "04"]
+        upcoming_items, ["cloud"], ["02", "03", "04"], upcoming_descriptions
     )
 
     # Analyze wind conditions
@@ -479,14 +489,20 @@ def _describe_tomorrow_outlook(
         return f"{upcoming_prefix} {temp_desc}"
 
 
-def _analyze_weather_periods(items, keywords, icon_codes):
-    """Analyze forecast items to find periods of specific weather conditions"""
+def _analyze_weather_periods(items, keywords, icon_codes, descriptions=None):
+    """Analyze forecast items to find periods of specific weather conditions
+
+    descriptions: optional lowercased item descriptions (same order as items),
+    so callers running several passes over the same items only lowercase once
+    """
     periods = []
     current_period = None
 
-    for item in items:
+    if descriptions is None:
+        descriptions = [item.get("description", "").lower() for item in items]
+
+    for item, description in zip(items, descriptions):
         timestamp = item.get("dt")
-        description = item.get("description", "").lower()
         icon = item.get("icon", "")
         pop = item.get("pop", 0)
 
@@ -718,13 +734,10 @@ def _describe_current_precipitation(
             # Find when snow returns after it clears
             end_timestamp = None
             for item in forecast_data:
-                if (
-                    item.get("weather_desc", "").lower().find("clear") != -1
-                    or item.get("weather_desc", "").lower().find("overcast") != -1
-                ):
+                item_desc = item.get("weather_desc", "").lower()
+                if "clear" in item_desc or "overcast" in item_desc:
                     if not any(
-                        precip in item.get("weather_desc", "").lower()
-                        for precip in ["snow", "rain", "storm"]
+                        precip in item_desc for precip in ["snow", "rain", "storm"]
                     ):
                         end_timestamp = item.get("timestamp", 0)
                         break
@@ -753,10 +766,10 @@ def _describe_current_precipitation(
         if clear_time:
             end_timestamp = None
             for item in forecast_data:
-                if item.get("weather_desc", "").lower().find("clear") != -1:
+                item_desc = item.get("weather_desc", "").lower()
+                if "clear" in item_desc:
                     if not any(
-                        precip in item.get("weather_desc", "").lower()
-                        for precip in ["rain", "snow", "storm"]
+                        precip in item_desc for precip in ["rain", "snow", "storm"]
                     ):
                         end_timestamp = item.get("timestamp", 0)
                         break
@@ -12,6 +12,13 @@ from weather.date_utils import (
 )
 from weather.weather_models import APIValidator
 
+# Air quality reported when the AQI API fails
+_FALLBACK_AIR_QUALITY = {
+    "aqi": 1,
+    "raw_aqi": 25,
+    "description": "Good",
+}
+
 
 def fetch_open_meteo_data(http_client, lat, lon, timezone_offset_hours=-5):
     """Fetch data from Open-Meteo API using injected HTTP client"""
@@ -167,32 +174,33 @@ def transform_open_meteo_response(
     times = hourly_validator.require("time")
 
     forecast_items = []
+    # Column lengths don't change inside the loop, so check them once
+    item_count = min(len(temps), 72) if temps else 0  # Up to 72 hours
+    time_count = len(times) if times else 0
+    pop_count = len(pops) if pops else 0
+    code_count = len(codes) if codes else 0
+
     # Use all hourly forecast data (skip first hour which is current)
-    if temps and len(temps) > 1:
-        for i in range(1, min(len(temps), 72)):  # Start at hour 1, up to 72 hours
-            if i < len(temps):
-                # Convert UTC timestamp to local time
-                utc_dt = (
-                    _parse_iso_timestamp(times[i])
-                    if times and i < len(times)
-                    else utc_timestamp + (i * 3600)
-                )
-                local_dt = utc_to_local(utc_dt, timezone_offset_hours)
-
-                forecast_item = {
-                    "dt": local_dt,
-                    "temp": round(temps[i]),
-                    "pop": (pops[i] / 100.0)
-                    if pops and i < len(pops) and pops[i] is not None
-                    else 0.0,
-                    "icon": map_weather_code_to_icon(
-                        codes[i] if codes and i < len(codes) else 0
-                    ),
-                    "description": map_weather_code_to_description(
-                        codes[i] if codes and i < len(codes) else 0
-                    ),
-                }
-                forecast_items.append(forecast_item)
+    for i in range(1, item_count):
+        # Convert UTC timestamp to local time
+        utc_dt = (
+            _parse_iso_timestamp(times[i])
+            if i < time_count
+            else utc_timestamp + (i * 3600)
+        )
+        local_dt = utc_to_local(utc_dt, timezone_offset_hours)
+        code = codes[i] if i < code_count else 0
+
+        forecast_item = {
+            "dt": local_dt,
+            "temp": round(temps[i]),
+            "pop": (pops[i] / 100.0)
+            if i < pop_count and pops[i] is not None
+            else 0.0,
+            "icon": map_weather_code_to_icon(code),
+            "description": map_weather_code_to_description(code),
+        }
+        forecast_items.append(forecast_item)
 
     # Build city info
     city_info = {
@@ -208,11 +216,7 @@ def transform_open_meteo_response(
     air_quality_data = parse_air_quality_data(aqi_response) if aqi_response else None
     if not air_quality_data:
         # Fallback for when AQI API fails
-        air_quality_data = {
-            "aqi": 1,
-            "raw_aqi": 25,
-            "description": "Good",
-        }
+        air_quality_data = dict(_FALLBACK_AIR_QUALITY)
 
     # Add air quality to current weather data for narrative generation
     current_weather["air_quality"] = air_quality_data
@@ -238,63 +242,80 @@ def transform_open_meteo_response(
     }
 
 
+# Open-Meteo weather code to description, built once rather than per call
+_DESCRIPTION_BY_CODE = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    56: "Light freezing drizzle",
+    57: "Dense freezing drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    66: "Light freezing rain",
+    67: "Heavy freezing rain",
+    71: "Slight snow fall",
+    73: "Moderate snow fall",
+    75: "Heavy snow fall",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail",
+}
+
+
 def map_weather_code_to_description(code):
     """Map Open-Meteo weather codes to descriptions"""
-    code_map = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Fog",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        56: "Light freezing drizzle",
-        57: "Dense freezing drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        66: "Light freezing rain",
-        67: "Heavy freezing rain",
-        71: "Slight snow fall",
-        73: "Moderate snow fall",
-        75: "Heavy snow fall",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail",
-    }
-    return code_map.get(code, f"Unknown weather code {code}")
+    return _DESCRIPTION_BY_CODE.get(code, f"Unknown weather code {code}")
+
+
+# Open-Meteo weather code to standard icon code
+_ICON_BY_CODE = {
+    0: "01d",  # Clear sky
+    1: "02d",  # Partly cloudy
+    2: "02d",
+    3: "04d",  # Overcast
+    45: "50d",  # Fog
+    48: "50d",
+    51: "09d",  # Drizzle
+    53: "09d",
+    55: "09d",
+    56: "09d",
+    57: "09d",
+    61: "10d",  # Rain
+    63: "10d",
+    65: "10d",
+    80: "10d",
+    81: "10d",
+    82: "10d",
+    66: "13d",  # Freezing rain
+    67: "13d",
+    71: "13d",  # Snow
+    73: "13d",
+    75: "13d",
+    77: "13d",
+    85: "13d",
+    86: "13d",
+    95: "11d",  # Thunderstorm
+    96: "11d",
+    99: "11d",
+}
 
 
 def map_weather_code_to_icon(code):
     """Map Open-Meteo weather codes to standard icon codes"""
-    if code == 0:
-        return "01d"  # Clear sky
-    elif code in [1, 2]:
-        return "02d"  # Partly cloudy
-    elif code == 3:
-        return "04d"  # Overcast
-    elif code in [45, 48]:
-        return "50d"  # Fog
-    elif code in [51, 53, 55, 56, 57]:
-        return "09d"  # Drizzle
-    elif code in [61, 63, 65, 80, 81, 82]:
-        return "10d"  # Rain
-    elif code in [66, 67]:
-        return "13d"  # Freezing rain
-    elif code in [71, 73, 75, 77, 85, 86]:
-        return "13d"  # Snow
-    elif code in [95, 96, 99]:
-        return "11d"  # Thunderstorm
-    else:
-        return "01d"  # Default to clear
+    return _ICON_BY_CODE.get(code, "01d")  # Default to clear
 
 
 def parse_air_quality_data(aqi_response):
@@ -339,6 +360,19 @@ def parse_air_quality_data(aqi_response):
         return None
 
 
+# Days elapsed before the first of each month (non-leap year)
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Leap years from year 1 up to 1970, subtracted to count from the epoch
+_LEAP_DAYS_BEFORE_1970 = 1969 // 4 - 1969 // 100 + 1969 // 400
+
+
+def _leap_days_before(year):
+    """Number of leap years from 1970 up to (not including) year"""
+    y = year - 1
+    return y // 4 - y // 100 + y // 400 - _LEAP_DAYS_BEFORE_1970
+
+
 def _parse_iso_timestamp(time_str):
     """Parse ISO 8601 timestamp to Unix timestamp"""
     try:
@@ -348,23 +382,13 @@ def _parse_iso_timestamp(time_str):
         year, month, day = map(int, date_part.split("-"))
         hour, minute = map(int, time_part.split(":"))
 
-        # More accurate Unix timestamp calculation
-        # Account for leap years properly
-        days_since_epoch = 0
-
-        # Add days for complete years since 1970
-        for y in range(1970, year):
-            if y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
-                days_since_epoch += 366  # leap year
-            else:
-                days_since_epoch += 365
+        # Whole years since 1970, plus one day per leap year in between
+        days_since_epoch = (year - 1970) * 365 + _leap_days_before(year)
 
         # Add days for complete months in the target year
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-            days_in_month[1] = 29  # February in leap year
-
-        days_since_epoch += sum(days_in_month[: month - 1])
+        days_since_epoch += _DAYS_BEFORE_MONTH[month - 1]
+        if month > 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            days_since_epoch += 1  # February in leap year
 
         # Add days for the current month (day - 1 because day 1 = 0 days elapsed)
         days_since_epoch += day - 1
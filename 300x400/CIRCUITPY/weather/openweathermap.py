@@ -7,6 +7,15 @@ from utils.logger import log, log_error
 
 from weather.date_utils import utc_to_local
 
+# Map AQI number to word description
+_AQI_DESCRIPTIONS = {
+    1: "Good",
+    2: "Fair",
+    3: "Moderate",
+    4: "Poor",
+    5: "Very Poor",
+}
+
 
 def manual_capitalize(text):
     """Manually capitalize first letter for CircuitPython compatibility"""
@@ -39,18 +48,9 @@ def parse_air_quality_data(aqi_data):
         current_aqi = aqi_data["list"][0]
         aqi_value = current_aqi["main"]["aqi"]
 
-        # Map AQI number to word description
-        aqi_descriptions = {
-            1: "Good",
-            2: "Fair",
-            3: "Moderate",
-            4: "Poor",
-            5: "Very Poor",
-        }
-
         return {
             "aqi": aqi_value,
-            "description": aqi_descriptions.get(aqi_value, "Unknown"),
+            "description": _AQI_DESCRIPTIONS.get(aqi_value, "Unknown"),
             "list": aqi_data["list"],  # Include full list for forecast matching
         }
 
@@ -128,25 +128,41 @@ def parse_forecast_data(forecast_data, timezone_offset_hours, air_quality_data=N
                     aqi_timestamp = utc_to_local(aqi_item["dt"], timezone_offset_hours)
                     aqi_lookup[aqi_timestamp] = aqi_item["main"]["aqi"]
 
+        # AQI readings in time order; forecast items are in time order too, so
+        # a single forward pass matches them instead of rescanning per item
+        aqi_points = sorted(aqi_lookup.items())
+        aqi_count = len(aqi_points)
+        aqi_index = 0
+
         # Parse forecast items (skip first item - it's used as current weather)
         for item in forecast_data["list"][1:]:
             # Convert UTC timestamp to local time
             local_timestamp = utc_to_local(item["dt"], timezone_offset_hours)
 
-            # Find matching AQI data (within 30 minutes)
+            # Find matching AQI data (earliest reading within 30 minutes)
+            while (
+                aqi_index < aqi_count
+                and aqi_points[aqi_index][0] < local_timestamp - 1800
+            ):
+                aqi_index += 1
             item_aqi = None
-            for aqi_ts, aqi_val in aqi_lookup.items():
-                if abs(local_timestamp - aqi_ts) <= 1800:  # 30 minutes
-                    item_aqi = aqi_val
-                    break
+            if (
+                aqi_index < aqi_count
+                and aqi_points[aqi_index][0] <= local_timestamp + 1800
+            ):
+                item_aqi = aqi_points[aqi_index][1]
+
+            # Look up the nested sections once per item
+            main = item["main"]
+            weather = item["weather"][0]
 
             forecast_item = {
                 "dt": local_timestamp,  # Local timestamp
-                "temp": round(item["main"]["temp"]),
-                "feels_like": round(item["main"]["feels_like"]),
-                "humidity": item["main"].get("humidity", 0),
-                "icon": item["weather"][0]["icon"],
-                "description": manual_capitalize(item["weather"][0]["description"]),
+                "temp": round(main["temp"]),
+                "feels_like": round(main["feels_like"]),
+                "humidity": main.get("humidity", 0),
+                "icon": weather["icon"],
+                "description": manual_capitalize(weather["description"]),
                 "pop": item.get("pop", 0),  # Precipitation probability
                 "aqi": item_aqi,
             }
@@ -290,13 +290,18 @@ def are_items_similar(item1, item2):
 
 def create_night_cell(night_items):
     """Create a consolidated NIGHT cell from multiple nighttime items"""
-    # Calculate averages
-    temps = [item.get("temp", 0) for item in night_items]
-    pops = [item.get("pop", 0) for item in night_items]
-    icons = [item.get("icon", "") for item in night_items]
-
-    avg_temp = round(sum(temps) / len(temps))
-    avg_pop = sum(pops) / len(pops)
+    # Calculate averages, summing in the same pass that collects the icons
+    temp_total = 0
+    pop_total = 0
+    icons = []
+    for item in night_items:
+        temp_total += item.get("temp", 0)
+        pop_total += item.get("pop", 0)
+        icons.append(item.get("icon", ""))
+
+    count = len(night_items)
+    avg_temp = round(temp_total / count)
+    avg_pop = pop_total / count
 
     # Find most frequent icon
     most_frequent_icon = get_most_frequent_icon(icons)
@@ -321,14 +326,19 @@ def create_night_cell(night_items):
 
 def create_consolidated_cell(items):
     """Create a consolidated cell from similar adjacent items"""
-    # Calculate averages
-    temps = [item.get("temp", 0) for item in items]
-    pops = [item.get("pop", 0) for item in items]
-    feels_likes = [item.get("feels_like", 0) for item in items]
+    # Calculate averages in one pass, without per-field lists
+    temp_total = 0
+    pop_total = 0
+    feels_like_total = 0
+    for item in items:
+        temp_total += item.get("temp", 0)
+        pop_total += item.get("pop", 0)
+        feels_like_total += item.get("feels_like", 0)
 
-    avg_temp = round(sum(temps) / len(temps))
-    avg_pop = sum(pops) / len(pops)
-    avg_feels_like = round(sum(feels_likes) / len(feels_likes))
+    count = len(items)
+    avg_temp = round(temp_total / count)
+    avg_pop = pop_total / count
+    avg_feels_like = round(feels_like_total / count)
 
     # Use middle timestamp for sorting
     middle_idx = len(items) // 2
@@ -522,10 +532,7 @@ def convert_weather_data_to_legacy_format(weather_data):
         }
         return result
 
-    # If already in legacy format, preserve air_quality if present
-    if isinstance(weather_data, dict) and "air_quality" in weather_data:
-        return weather_data
-
+    # Already in legacy format (air_quality, if present, is kept as-is)
     return weather_data
 
 
@@ -14,11 +14,16 @@ WEATHER_HISTORY_FILENAME = "weather_history.json"
 # Global history data source (for dependency injection)
 _history_data_source = None
 
+# Last filesystem yesterday lookup as (yesterday day number, result);
+# cleared whenever the history file is saved
+_yesterday_lookup = None
+
 
 def set_filesystem(filesystem):
     """Set the filesystem to use for weather history (hardware SD card mode)"""
-    global _filesystem
+    global _filesystem, _yesterday_lookup
     _filesystem = filesystem
+    _yesterday_lookup = None
 
 
 def set_history_data_source(data_source):
@@ -32,10 +37,22 @@ def set_history_data_source(data_source):
     _history_data_source = data_source
 
 
+# Recent day number -> "YYYY-MM-DD"; every timestamp in a day shares one entry
+_date_string_cache = {}
+_DATE_STRING_CACHE_SIZE = 4
+
+
 def get_date_string(timestamp):
     """Convert timestamp to YYYY-MM-DD format"""
-    year, month, day, _, _, _, _ = _timestamp_to_components(timestamp)
-    return f"{year:04d}-{month:02d}-{day:02d}"
+    day_number = int(timestamp // 86400)
+    date_string = _date_string_cache.get(day_number)
+    if date_string is None:
+        year, month, day, _, _, _, _ = _timestamp_to_components(day_number * 86400)
+        date_string = f"{year:04d}-{month:02d}-{day:02d}"
+        if len(_date_string_cache) >= _DATE_STRING_CACHE_SIZE:
+            _date_string_cache.clear()
+        _date_string_cache[day_number] = date_string
+    return date_string
 
 
 def _filesystem_available():
@@ -65,9 +82,11 @@ def load_weather_history():
 
 def save_weather_history(history_data):
     """Save weather history to filesystem (hardware mode only)"""
+    global _yesterday_lookup
     if not _filesystem_available():
         return False
 
+    _yesterday_lookup = None
     if _filesystem.write_json(WEATHER_HISTORY_FILENAME, history_data):
         return True
     else:
@@ -91,17 +110,18 @@ def store_today_temperatures(current_timestamp, current_temp, high_temp, low_tem
     history = load_weather_history()
     history[today_date] = {"current": current_temp, "high": high_temp, "low": low_temp}
 
-    # Keep only last 10 days to save space
-    dates = sorted(history.keys())
-    if len(dates) > 10:
-        for old_date in dates[:-10]:
-            del history[old_date]
+    # Keep only last 10 days to save space. Usually at most one date is over
+    # the limit, so drop the oldest directly instead of sorting every key.
+    while len(history) > 10:
+        del history[min(history)]
 
     return save_weather_history(history)
 
 
 def get_yesterday_temperatures(current_timestamp):
     """Get yesterday's temperatures (using injected data source if available)"""
+    global _yesterday_lookup
+
     # Use injected data source if available (preview mode)
     if _history_data_source:
         # print(f"DEBUG: Using injected data source for timestamp {current_timestamp}")
@@ -115,9 +135,17 @@ def get_yesterday_temperatures(current_timestamp):
         return None
 
     yesterday_timestamp = current_timestamp - 86400
+
+    # Refreshes within the same day ask for the same date; skip reloading the
+    # history until it's saved again
+    day_number = int(yesterday_timestamp // 86400)
+    if _yesterday_lookup is not None and _yesterday_lookup[0] == day_number:
+        return _yesterday_lookup[1]
+
     yesterday_date = get_date_string(yesterday_timestamp)
     history = load_weather_history()
     result = history.get(yesterday_date)
+    _yesterday_lookup = (day_number, result)
     # print(f"DEBUG: Filesystem lookup returned: {result}")
     return result
 
@@ -7,8 +7,12 @@ import os
 
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from preview/.env directly; only fall back to
+# python-dotenv's directory search when that file is missing
+_ENV_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"
+)
+load_dotenv(_ENV_PATH if os.path.exists(_ENV_PATH) else None)
 
 # Weather Provider Configuration
 WEATHER_PROVIDER = "openweathermap"  # "openweathermap" or "open_meteo"
@@ -2,6 +2,7 @@
 Efficient CSV loading using existing open_meteo_converter
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -9,9 +10,29 @@ from pathlib import Path
 preview_dir = Path(__file__).parent.parent
 if str(preview_dir) not in sys.path:
     sys.path.insert(0, str(preview_dir))
+hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
+if str(hardware_path) not in sys.path:
+    sys.path.insert(0, str(hardware_path))
 
 from shared.open_meteo_converter import OpenMeteoConverter
 
+# Hardware weather_api module, imported on first use (needs the preview config)
+_weather_api = None
+
+
+def _get_weather_api():
+    """Import the hardware weather_api module once, from the hardware directory"""
+    global _weather_api
+    if _weather_api is None:
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(hardware_path)
+            from weather import weather_api
+        finally:
+            os.chdir(original_cwd)
+        _weather_api = weather_api
+    return _weather_api
+
 
 class CSVWeatherLoader:
     """CSV loader using existing open-meteo converter"""
@@ -19,10 +40,25 @@ class CSVWeatherLoader:
     def __init__(self, csv_file):
         self.csv_file = Path(csv_file)
         self.converter = OpenMeteoConverter(str(csv_file))
+        self._records = None  # Full record list, built on first unlimited call
         print(f"Loaded Open-Meteo CSV from {csv_file}")
 
     def get_records(self, limit=None):
-        """Get records as list of dicts, optionally limited"""
+        """Get records as list of dicts, optionally limited
+
+        The full record list is built once and reused, so repeated lookups
+        (e.g. every preview request for a scenario) don't re-convert the CSV.
+        """
+        if self._records is not None:
+            return self._records[:limit] if limit else self._records
+
+        records = self._build_records(limit)
+        if not limit and records:
+            self._records = records
+        return records
+
+    def _build_records(self, limit=None):
+        """Convert hourly CSV rows to record dicts"""
         try:
             # Parse CSV to get hourly data
             self.converter._parse_csv()
@@ -159,28 +195,24 @@ class CSVWeatherLoader:
         #     f"DEBUG: get_historical_context - current_index={current_index}, lookback_hours={lookback_hours}, start_index={start_index}"
         # )
 
-        for i in range(start_index, current_index):
-            if i < len(self.converter.hourly_data):
-                row = self.converter.hourly_data[i]
-                timestamp = self.converter._parse_timestamp(row["time"])
-                if timestamp:
-                    historical_record = {
-                        "timestamp": timestamp,
-                        "temperature": self.converter._safe_float(
-                            row.get("temperature_2m (°C)", 20)
-                        ),
-                        "humidity": self.converter._safe_int(
-                            row.get("relative_humidity_2m (%)", 65)
-                        ),
-                        "weather_code": self.converter._safe_int(
-                            row.get("weather_code (wmo code)", 0)
-                        ),
-                        "is_day": self.converter._safe_int(row.get("is_day ()", 1)),
-                        "wind_speed": self.converter._safe_float(
-                            row.get("wind_speed_10m (km/h)", 0)
-                        ),
-                    }
-                    history.append(historical_record)
+        # Row timestamps were parsed once when the CSV was loaded
+        converter = self.converter
+        safe_float = converter._safe_float
+        safe_int = converter._safe_int
+        rows = converter.hourly_data[start_index:current_index]
+        timestamps = converter._hourly_ts[start_index:current_index]
+
+        for row, timestamp in zip(rows, timestamps):
+            if timestamp:
+                historical_record = {
+                    "timestamp": timestamp,
+                    "temperature": safe_float(row.get("temperature_2m (°C)", 20)),
+                    "humidity": safe_int(row.get("relative_humidity_2m (%)", 65)),
+                    "weather_code": safe_int(row.get("weather_code (wmo code)", 0)),
+                    "is_day": safe_int(row.get("is_day ()", 1)),
+                    "wind_speed": safe_float(row.get("wind_speed_10m (km/h)", 0)),
+                }
+                history.append(historical_record)
 
         # print(f"DEBUG: get_historical_context returning {len(history)} records")
         return history
@@ -212,20 +244,8 @@ class CSVWeatherLoader:
             if historical_context:
                 intermediate_data["historical_context"] = historical_context
 
-            # Import weather_api module to process the data into display format
-            hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
-            if str(hardware_path) not in sys.path:
-                sys.path.insert(0, str(hardware_path))
-
-            # Change to hardware directory for proper import context
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(hardware_path)
-                from weather import weather_api
-            finally:
-                os.chdir(original_cwd)
+            # weather_api processes the data into display format
+            weather_api = _get_weather_api()
 
             # Transform from intermediate format to display variables format
             display_data = weather_api.get_display_variables(intermediate_data)
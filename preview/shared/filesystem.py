@@ -14,6 +14,8 @@ class FileSystem:
         # Store files in preview/.cache/ (not preview/shared/.cache/)
         self.base_path = Path(__file__).parent.parent / ".cache"
         self.base_path.mkdir(exist_ok=True)
+        # filename -> (mtime_ns, size, raw bytes) for files read or written as JSON
+        self._json_cache = {}
 
     def is_available(self):
         """Always available for preview"""
@@ -22,11 +24,9 @@ class FileSystem:
     def append_text(self, filename, content):
         """Append text to file (for logging)"""
         try:
-            (self.base_path / filename).write_text(
-                (self.base_path / filename).read_text() + content + "\n"
-                if (self.base_path / filename).exists()
-                else content + "\n"
-            )
+            # Append in place instead of reading and rewriting the whole file
+            with open(self.base_path / filename, "a") as f:
+                f.write(content + "\n")
             return True
         except:
             return False
@@ -34,20 +34,44 @@ class FileSystem:
     def write_json(self, filename, data):
         """Write JSON data (for weather persistence)"""
         try:
-            with open(self.base_path / filename, "w") as f:
-                json.dump(data, f)
+            file_path = self.base_path / filename
+            # Encode first, then write once (json.dump writes chunk by chunk)
+            content = json.dumps(data, separators=(",", ":"))
+            with open(file_path, "w") as f:
+                f.write(content)
+            self._remember_json(filename, file_path, content.encode())
             return True
         except:
+            self._json_cache.pop(filename, None)
             return False
 
     def read_json(self, filename):
-        """Read JSON data"""
+        """Read JSON data
+
+        The file's bytes are kept in memory and reused until its mtime or size
+        changes, skipping the open and read; parsing them gives each caller
+        its own data to modify.
+        """
         try:
-            with open(self.base_path / filename, "r") as f:
-                return json.load(f)
+            file_path = self.base_path / filename
+            stat = file_path.stat()
+            cached = self._json_cache.get(filename)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return json.loads(cached[2])
+
+            # One binary read; json.loads decodes the UTF-8 bytes itself
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            self._json_cache[filename] = (stat.st_mtime_ns, stat.st_size, raw)
+            return json.loads(raw)
         except:
             return None
 
+    def _remember_json(self, filename, file_path, raw):
+        """Cache bytes just written so the next read_json doesn't re-read them"""
+        stat = file_path.stat()
+        self._json_cache[filename] = (stat.st_mtime_ns, stat.st_size, raw)
+
     def count_lines(self, filename):
         """Count lines in text file"""
         try:
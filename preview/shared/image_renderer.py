@@ -3,8 +3,10 @@ Centralized image renderer for preview system
 Simplified approach that just works
 """
 
+import hashlib
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 # Setup environment and paths
@@ -51,6 +53,94 @@ _display_function = None
 # Global variable to capture generated narrative
 _last_generated_narrative = None
 
+# Recently encoded PNGs keyed by a digest of their raw pixels, so re-rendering
+# an unchanged screen skips the PNG encode
+_png_cache = OrderedDict()
+_PNG_CACHE_SIZE = 32
+
+
+def _surface_pixels(surface):
+    """Copy a pygame surface's pixels out as (raw RGB bytes, (width, height))"""
+    import pygame
+
+    return pygame.image.tobytes(surface, "RGB"), surface.get_size()
+
+
+def _pixels_to_png_bytes(raw, size):
+    """Encode raw RGB pixels to PNG bytes
+
+    Uses Pillow with a low zlib level instead of pygame's default encoder;
+    the preview images are tiny and served over localhost, so encode speed
+    matters more than a few percent of file size.
+    """
+    import io
+
+    from PIL import Image
+
+    key = hashlib.blake2b(raw, digest_size=16).digest() + repr(size).encode()
+    cached = _png_cache.get(key)
+    if cached is not None:
+        _png_cache.move_to_end(key)
+        return cached
+
+    image = Image.frombytes("RGB", size, raw)
+    save_options = {"compress_level": 1, "optimize": False}
+
+    # The e-ink layout only uses a handful of colors, so store it as a
+    # low bit-depth paletted PNG (lossless, far fewer bytes to deflate)
+    colors = image.getcolors(16)
+    if colors is not None:
+        image = image.convert("P", palette=Image.ADAPTIVE, colors=len(colors))
+        save_options["bits"] = 2 if len(colors) <= 4 else 4
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", **save_options)
+    png_bytes = buffer.getvalue()
+
+    _png_cache[key] = png_bytes
+    if len(_png_cache) > _PNG_CACHE_SIZE:
+        _png_cache.popitem(last=False)
+    return png_bytes
+
+
+def _pixels_to_bmp_bytes(raw, size):
+    """Encode raw RGB pixels to BMP bytes (no compression step at all)"""
+    import io
+
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", size, raw).save(buffer, format="BMP")
+    return buffer.getvalue()
+
+
+class RenderedImage:
+    """Pixels of one rendered screen, encoded on demand
+
+    Each format ("png" or "bmp") is encoded straight from the pixels the
+    first time it is asked for and kept, so serving BMP never pays for a
+    PNG deflate and serving either one again costs nothing.
+    """
+
+    __slots__ = ("size", "_raw", "_encoded")
+
+    def __init__(self, raw, size):
+        self.size = size
+        self._raw = raw
+        self._encoded = {}
+
+    def encode(self, image_format="png"):
+        """Get the image as BMP bytes for "bmp", PNG bytes otherwise"""
+        image_format = "bmp" if image_format == "bmp" else "png"
+        data = self._encoded.get(image_format)
+        if data is None:
+            if image_format == "bmp":
+                data = _pixels_to_bmp_bytes(self._raw, self.size)
+            else:
+                data = _pixels_to_png_bytes(self._raw, self.size)
+            self._encoded[image_format] = data
+        return data
+
 
 class WeatherImageRenderer:
     """Centralized weather image renderer for preview system"""
@@ -254,9 +344,25 @@ class WeatherImageRenderer:
         Returns:
             PNG bytes on success, None on failure
         """
-        try:
-            import io
+        image = self.render_weather_data_to_image(
+            weather_data, use_icons, indoor_temp_humidity
+        )
+        return image.encode("png") if image else None
+
+    def render_weather_data_to_image(
+        self, weather_data, use_icons=True, indoor_temp_humidity="20°69%"
+    ):
+        """Render weather data to a RenderedImage (encoded later, per format)
+
+        Args:
+            weather_data: Display variables from weather_api.get_display_variables()
+            use_icons: Whether to load and display weather icons
+            indoor_temp_humidity: Indoor temperature/humidity string
 
+        Returns:
+            RenderedImage on success, None on failure
+        """
+        try:
             self._ensure_display()
 
             # Create layout and capture narrative
@@ -269,29 +375,22 @@ class WeatherImageRenderer:
             if self.pygame_display.display is None:
                 self.pygame_display.start()
 
-            # Change to hardware directory for font loading during render
-            os.chdir(hardware_path)
-            try:
-                # Render image
-                import pygame
-
-                self.pygame_display.display.root_group = layout
-                self.pygame_display.display.refresh()
+            # Render image. Fonts are loaded (relative to the hardware
+            # directory) while the layout is built; the refresh only draws
+            # loaded glyphs and open icon files, so it needs no chdir.
+            self.pygame_display.display.root_group = layout
+            self.pygame_display.display.refresh()
 
-                # Save to bytes buffer instead of file
-                buffer = io.BytesIO()
-                pygame.image.save(
-                    self.pygame_display.display._pygame_screen, buffer, "PNG"
-                )
-                self.pygame_display.display.root_group = None
+            # Copy the pixels out; encoding waits until a format is requested
+            image = RenderedImage(
+                *_surface_pixels(self.pygame_display.display._pygame_screen)
+            )
+            self.pygame_display.display.root_group = None
 
-                return buffer.getvalue()
-            finally:
-                # Always restore original directory
-                os.chdir(self.original_cwd)
+            return image
 
         except Exception as e:
-            print(f"Error rendering weather image to bytes: {e}")
+            print(f"Error rendering weather image: {e}")
             return None
 
     def measure_narrative_text(self, weather_data):
@@ -339,8 +438,8 @@ class WeatherImageRenderer:
                 wrap_result = self.pygame_display._get_wrapped_text_and_count(narrative)
                 line_count = wrap_result["line_count"]
                 wrapped_text = wrap_result["wrapped_text"]
-                char_count = len(self.pygame_display._strip_markup_tags(narrative))
                 stripped_text = self.pygame_display._strip_markup_tags(narrative)
+                char_count = len(stripped_text)
             finally:
                 os.chdir(self.original_cwd)
 
@@ -553,6 +652,20 @@ def render_weather_to_bytes(weather_data, **kwargs):
         return renderer.render_weather_data_to_bytes(weather_data, **kwargs)
 
 
+def render_weather_to_image(weather_data, **kwargs):
+    """Convenience function to render weather data to a RenderedImage
+
+    Args:
+        weather_data: Display variables from weather_api.get_display_variables()
+        **kwargs: Additional arguments passed to render_weather_data_to_image
+
+    Returns:
+        RenderedImage on success, None on failure
+    """
+    with WeatherImageRenderer() as renderer:
+        return renderer.render_weather_data_to_image(weather_data, **kwargs)
+
+
 def measure_narrative_text_fit(weather_data):
     """Convenience function to measure narrative text fit with auto-cleanup
 
@@ -3,8 +3,11 @@ Centralized logger for web modules
 Provides simple logging functions with global silent mode control
 """
 
+import os
+
 # Global configuration
 _silent_mode = False
+_debug_mode = bool(os.getenv("PINKWEATHER_DEBUG"))
 
 
 def set_silent_mode(silent=True):
@@ -26,6 +29,29 @@ def is_silent():
     return _silent_mode
 
 
+def set_debug_mode(debug=True):
+    """Enable or disable verbose debug output globally
+
+    Defaults to on when the PINKWEATHER_DEBUG environment variable is set.
+
+    Args:
+        debug (bool): If True, emit log_debug output
+    """
+    global _debug_mode
+    _debug_mode = debug
+
+
+def is_debug_mode():
+    """Check if debug output is enabled
+
+    Use this to skip building expensive debug messages entirely.
+
+    Returns:
+        bool: True if debug mode is enabled and not silenced
+    """
+    return _debug_mode and not _silent_mode
+
+
 def log(message):
     """Log message
 
@@ -44,3 +70,13 @@ def log_error(message):
     """
     if not _silent_mode:
         print(f"ERROR: {message}")
+
+
+def log_debug(message):
+    """Log message only when debug mode is enabled
+
+    Args:
+        message: Debug message to log
+    """
+    if _debug_mode and not _silent_mode:
+        print(message)
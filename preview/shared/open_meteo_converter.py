@@ -1,24 +1,396 @@
 """
 Open-Meteo CSV to OpenWeatherMap API format converter
-Integrates with existing mock weather data system for web preview
+Provides historical CSV weather data for web preview
 """
 
 import csv
 import json
+import marshal
 import os
-from datetime import datetime
+import sys
+import time
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+
+# CircuitPython code path (weather_history), added once at import
+_CIRCUITPY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "300x400",
+    "CIRCUITPY",
+)
+if _CIRCUITPY_PATH not in sys.path:
+    sys.path.insert(0, _CIRCUITPY_PATH)
 
 # Import centralized logger
 from shared.logger import log, log_error
+from weather.weather_history import store_today_temperatures
+
+# Centralized dataset config, resolved once rather than on every get_converter
+try:
+    from csv_config import DATASETS, DEFAULT_DATASET, get_dataset_info
+except ImportError:
+    from web.csv_config import DATASETS, DEFAULT_DATASET, get_dataset_info
+
+
+TEMPERATURE_COLUMN = "temperature_2m (°C)"
+
+# First characters of a numeric CSV cell ("nan"/blank cells never match)
+_NUMERIC_START = frozenset("-0123456789.")
+
+# Lowercased cell text that means "no value" for _safe_float/_safe_int
+_MISSING_VALUES = frozenset(("nan", "", "null"))
+
+
+def _fast_float(value, default=0.0):
+    """float() for numeric CSV cells, default for nan/blank without raising"""
+    if value and value[0] in _NUMERIC_START:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return default
+
+
+def _format_dt_txt(timestamp):
+    """Local "YYYY-MM-DD HH:MM:SS" for a forecast item's dt_txt
+
+    Same result as datetime.fromtimestamp(timestamp).strftime(...), formatted
+    straight from the time fields without a datetime object or strftime.
+    """
+    t = time.localtime(timestamp)
+    return "%04d-%02d-%02d %02d:%02d:%02d" % (
+        t.tm_year,
+        t.tm_mon,
+        t.tm_mday,
+        t.tm_hour,
+        t.tm_min,
+        t.tm_sec,
+    )
+
+
+# WMO weather code to OpenWeatherMap icon/description mapping
+_WMO_TO_OPENWEATHER = {
+    0: {
+        "description": "clear sky",
+        "icon_day": "01d",
+        "icon_night": "01n",
+        "main": "Clear",
+    },
+    1: {
+        "description": "mainly clear",
+        "icon_day": "01d",
+        "icon_night": "01n",
+        "main": "Clear",
+    },
+    2: {
+        "description": "partly cloudy",
+        "icon_day": "02d",
+        "icon_night": "02n",
+        "main": "Clouds",
+    },
+    3: {
+        "description": "overcast",
+        "icon_day": "04d",
+        "icon_night": "04n",
+        "main": "Clouds",
+    },
+    45: {
+        "description": "fog",
+        "icon_day": "50d",
+        "icon_night": "50n",
+        "main": "Fog",
+    },
+    48: {
+        "description": "depositing rime fog",
+        "icon_day": "50d",
+        "icon_night": "50n",
+        "main": "Fog",
+    },
+    51: {
+        "description": "light drizzle",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Drizzle",
+    },
+    53: {
+        "description": "moderate drizzle",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Drizzle",
+    },
+    55: {
+        "description": "dense drizzle",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Drizzle",
+    },
+    56: {
+        "description": "light freezing drizzle",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Drizzle",
+    },
+    57: {
+        "description": "dense freezing drizzle",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Drizzle",
+    },
+    61: {
+        "description": "slight rain",
+        "icon_day": "10d",
+        "icon_night": "10n",
+        "main": "Rain",
+    },
+    63: {
+        "description": "moderate rain",
+        "icon_day": "10d",
+        "icon_night": "10n",
+        "main": "Rain",
+    },
+    65: {
+        "description": "heavy rain",
+        "icon_day": "10d",
+        "icon_night": "10n",
+        "main": "Rain",
+    },
+    66: {
+        "description": "light freezing rain",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Rain",
+    },
+    67: {
+        "description": "heavy freezing rain",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Rain",
+    },
+    71: {
+        "description": "slight snow fall",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Snow",
+    },
+    73: {
+        "description": "moderate snow fall",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Snow",
+    },
+    75: {
+        "description": "heavy snow fall",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Snow",
+    },
+    77: {
+        "description": "snow grains",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Snow",
+    },
+    80: {
+        "description": "slight rain showers",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Rain",
+    },
+    81: {
+        "description": "moderate rain showers",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Rain",
+    },
+    82: {
+        "description": "violent rain showers",
+        "icon_day": "09d",
+        "icon_night": "09n",
+        "main": "Rain",
+    },
+    85: {
+        "description": "slight snow showers",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Snow",
+    },
+    86: {
+        "description": "heavy snow showers",
+        "icon_day": "13d",
+        "icon_night": "13n",
+        "main": "Snow",
+    },
+    95: {
+        "description": "slight thunderstorm",
+        "icon_day": "11d",
+        "icon_night": "11n",
+        "main": "Thunderstorm",
+    },
+    96: {
+        "description": "thunderstorm with slight hail",
+        "icon_day": "11d",
+        "icon_night": "11n",
+        "main": "Thunderstorm",
+    },
+    99: {
+        "description": "thunderstorm with heavy hail",
+        "icon_day": "11d",
+        "icon_night": "11n",
+        "main": "Thunderstorm",
+    },
+}
+
+
+def _build_condition(code, weather_info, is_day):
+    """OpenWeather-format condition dict for a WMO code"""
+    return {
+        "id": code + 800,  # Offset to avoid conflicts with OpenWeather IDs
+        "main": weather_info["main"],
+        "description": weather_info["description"],
+        "icon": weather_info["icon_day"] if is_day else weather_info["icon_night"],
+    }
+
+
+# OpenWeather condition dicts baked once per known code as (night, day), so
+# each row is a lookup instead of building a new dict
+_CONDITIONS = {
+    code: (_build_condition(code, info, False), _build_condition(code, info, True))
+    for code, info in _WMO_TO_OPENWEATHER.items()
+}
+
+
+# Part-of-day "sys" sections; identical for every day/night item, so items
+# share these instead of each building its own (don't modify them)
+_SYS_DAY = {"pod": "d"}
+_SYS_NIGHT = {"pod": "n"}
+
+
+# Parsed CSV sections shared by every converter reading the same file,
+# keyed by (absolute path, mtime) so an edited file is parsed again
+_parsed_csv_cache = {}
+
+# On-disk copies of parsed CSV sections, so other processes (server restarts,
+# batch runs) skip parsing the same file again
+_PARSED_CSV_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"
+)
+
+# Bumped whenever the saved layout changes, so older saved copies are
+# parsed again instead of unpacked wrongly
+_PARSED_CSV_FORMAT = 3
+
+
+def _remember_parsed_csv(cache_key, sections):
+    """Keep parsed sections in memory, dropping older versions of the same file"""
+    csv_path = cache_key[0]
+    for stale_key in [key for key in _parsed_csv_cache if key[0] == csv_path]:
+        del _parsed_csv_cache[stale_key]
+    _parsed_csv_cache[cache_key] = sections
+
+
+def _parsed_csv_file(csv_path):
+    """Path of the on-disk parsed copy of csv_path"""
+    return os.path.join(
+        _PARSED_CSV_DIR, os.path.basename(csv_path) + ".parsed.marshal"
+    )
+
+
+def _load_parsed_csv(csv_path, csv_stat):
+    """Parsed sections saved by an earlier process, or None if missing/stale
+
+    Saved with marshal, which only holds plain data (no pickle-style code
+    execution on load); the layout is still checked before it's used.
+    """
+    try:
+        with open(_parsed_csv_file(csv_path), "rb") as f:
+            saved = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if (
+        not isinstance(saved, dict)
+        or saved.get("format") != _PARSED_CSV_FORMAT
+        or saved.get("source") != csv_path
+        or saved.get("mtime_ns") != csv_stat.st_mtime_ns
+        or saved.get("size") != csv_stat.st_size
+    ):
+        return None
+
+    try:
+        hourly_data, daily_data, hourly_ts, sun_times = saved["sections"]
+        if not (
+            isinstance(hourly_data, list)
+            and isinstance(daily_data, list)
+            and isinstance(hourly_ts, list)
+            and len(hourly_ts) == len(hourly_data)
+        ):
+            return None
+        # Dates are saved as ordinals (marshal has no date type)
+        daily_by_date = {
+            date.fromordinal(ordinal): (sunrise_ts, sunset_ts)
+            for ordinal, sunrise_ts, sunset_ts in sun_times
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+    return hourly_data, daily_data, hourly_ts, daily_by_date
+
+
+def _save_parsed_csv(csv_path, csv_stat, sections):
+    """Save parsed sections for other processes; best effort"""
+    hourly_data, daily_data, hourly_ts, daily_by_date = sections
+    target = _parsed_csv_file(csv_path)
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    saved = {
+        "format": _PARSED_CSV_FORMAT,
+        "source": csv_path,
+        "mtime_ns": csv_stat.st_mtime_ns,
+        "size": csv_stat.st_size,
+        "sections": (
+            hourly_data,
+            daily_data,
+            hourly_ts,
+            [
+                (day.toordinal(), sunrise_ts, sunset_ts)
+                for day, (sunrise_ts, sunset_ts) in daily_by_date.items()
+            ],
+        ),
+    }
+    try:
+        os.makedirs(_PARSED_CSV_DIR, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            marshal.dump(saved, f)
+        # Atomic swap, so a concurrent reader never sees a partial file
+        os.replace(temp_path, target)
+    except (OSError, ValueError) as e:
+        log_error(f"Could not save parsed CSV cache: {e}")
 
 
 class OpenMeteoConverter:
     """Convert Open-Meteo CSV data to OpenWeatherMap API format"""
 
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    # in the per-row loops
+    __slots__ = (
+        "csv_filepath",
+        "hourly_data",
+        "daily_data",
+        "_hourly_ts",
+        "_daily_by_date",
+        "_parsed",
+        "city_name",
+        "lat",
+        "lon",
+    )
+
+    # Shared by every instance rather than rebuilt per converter
+    wmo_to_openweather = _WMO_TO_OPENWEATHER
+
     def __init__(self, csv_filepath, city_name=None, lat=None, lon=None):
         self.csv_filepath = csv_filepath
         self.hourly_data = []
         self.daily_data = []
+        self._hourly_ts = []  # Unix timestamp of each hourly row, in order
+        self._daily_by_date = {}  # date -> (sunrise_ts, sunset_ts)
         self._parsed = False
 
         # Extract city info from filepath or use provided values
@@ -29,221 +401,110 @@ class OpenMeteoConverter:
         else:
             self._extract_location_from_filepath()
 
-        # WMO weather code to OpenWeatherMap icon/description mapping
-        self.wmo_to_openweather = {
-            0: {
-                "description": "clear sky",
-                "icon_day": "01d",
-                "icon_night": "01n",
-                "main": "Clear",
-            },
-            1: {
-                "description": "mainly clear",
-                "icon_day": "01d",
-                "icon_night": "01n",
-                "main": "Clear",
-            },
-            2: {
-                "description": "partly cloudy",
-                "icon_day": "02d",
-                "icon_night": "02n",
-                "main": "Clouds",
-            },
-            3: {
-                "description": "overcast",
-                "icon_day": "04d",
-                "icon_night": "04n",
-                "main": "Clouds",
-            },
-            45: {
-                "description": "fog",
-                "icon_day": "50d",
-                "icon_night": "50n",
-                "main": "Fog",
-            },
-            48: {
-                "description": "depositing rime fog",
-                "icon_day": "50d",
-                "icon_night": "50n",
-                "main": "Fog",
-            },
-            51: {
-                "description": "light drizzle",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Drizzle",
-            },
-            53: {
-                "description": "moderate drizzle",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Drizzle",
-            },
-            55: {
-                "description": "dense drizzle",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Drizzle",
-            },
-            56: {
-                "description": "light freezing drizzle",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Drizzle",
-            },
-            57: {
-                "description": "dense freezing drizzle",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Drizzle",
-            },
-            61: {
-                "description": "slight rain",
-                "icon_day": "10d",
-                "icon_night": "10n",
-                "main": "Rain",
-            },
-            63: {
-                "description": "moderate rain",
-                "icon_day": "10d",
-                "icon_night": "10n",
-                "main": "Rain",
-            },
-            65: {
-                "description": "heavy rain",
-                "icon_day": "10d",
-                "icon_night": "10n",
-                "main": "Rain",
-            },
-            66: {
-                "description": "light freezing rain",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Rain",
-            },
-            67: {
-                "description": "heavy freezing rain",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Rain",
-            },
-            71: {
-                "description": "slight snow fall",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Snow",
-            },
-            73: {
-                "description": "moderate snow fall",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Snow",
-            },
-            75: {
-                "description": "heavy snow fall",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Snow",
-            },
-            77: {
-                "description": "snow grains",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Snow",
-            },
-            80: {
-                "description": "slight rain showers",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Rain",
-            },
-            81: {
-                "description": "moderate rain showers",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Rain",
-            },
-            82: {
-                "description": "violent rain showers",
-                "icon_day": "09d",
-                "icon_night": "09n",
-                "main": "Rain",
-            },
-            85: {
-                "description": "slight snow showers",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Snow",
-            },
-            86: {
-                "description": "heavy snow showers",
-                "icon_day": "13d",
-                "icon_night": "13n",
-                "main": "Snow",
-            },
-            95: {
-                "description": "slight thunderstorm",
-                "icon_day": "11d",
-                "icon_night": "11n",
-                "main": "Thunderstorm",
-            },
-            96: {
-                "description": "thunderstorm with slight hail",
-                "icon_day": "11d",
-                "icon_night": "11n",
-                "main": "Thunderstorm",
-            },
-            99: {
-                "description": "thunderstorm with heavy hail",
-                "icon_day": "11d",
-                "icon_night": "11n",
-                "main": "Thunderstorm",
-            },
-        }
-
     def _parse_csv(self):
         """Parse the Open-Meteo CSV file into hourly and daily data sections"""
         if self._parsed:
             return
 
-        with open(self.csv_filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        lines = content.strip().split("\n")
-        current_section = None
+        csv_path = os.path.abspath(self.csv_filepath)
+        csv_stat = os.stat(csv_path)
+        cache_key = (csv_path, csv_stat.st_mtime_ns)
+        cached = _parsed_csv_cache.get(cache_key)
+        if cached is None:
+            # Parsed by an earlier process already?
+            cached = _load_parsed_csv(csv_path, csv_stat)
+            if cached is not None:
+                _remember_parsed_csv(cache_key, cached)
+        if cached is not None:
+            (
+                self.hourly_data,
+                self.daily_data,
+                self._hourly_ts,
+                self._daily_by_date,
+            ) = cached
+            self._parsed = True
+            return
 
-        for line in lines:
-            if not line.strip():
-                continue
+        # Row list and column names of the section being read; lines before
+        # the first section header (location metadata) are skipped
+        section_rows = None
+        fieldnames = None
 
-            # Detect section type by header
-            if line.startswith("time,temperature_2m"):
-                current_section = "hourly"
-                hourly_reader = csv.DictReader([line])
-                hourly_fieldnames = hourly_reader.fieldnames
-                continue
-            elif line.startswith("time,sunrise"):
-                current_section = "daily"
-                daily_reader = csv.DictReader([line])
-                daily_fieldnames = daily_reader.fieldnames
-                continue
-
-            # Parse data based on current section
-            if current_section == "hourly":
-                try:
-                    row_dict = dict(zip(hourly_fieldnames, line.split(",")))
-                    self.hourly_data.append(row_dict)
-                except:
-                    continue
-            elif current_section == "daily":
-                try:
-                    row_dict = dict(zip(daily_fieldnames, line.split(",")))
-                    self.daily_data.append(row_dict)
-                except:
+        # Read line by line rather than holding the whole file and a list of
+        # its lines in memory at once
+        with open(self.csv_filepath, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line or line.isspace():
                     continue
 
+                # Detect section type by header. Data rows start with a digit (the
+                # date), so only lines starting with "t" need the prefix checks.
+                if line[0] == "t":
+                    if line.startswith("time,temperature_2m"):
+                        section_rows = self.hourly_data
+                        fieldnames = csv.DictReader([line]).fieldnames
+                        continue
+                    elif line.startswith("time,sunrise"):
+                        section_rows = self.daily_data
+                        fieldnames = csv.DictReader([line]).fieldnames
+                        continue
+
+                # Data row of the current section
+                if section_rows is not None:
+                    section_rows.append(dict(zip(fieldnames, line.split(","))))
+
+        # Each row's time, for bisecting in find_closest_timestamp_index
+        self._hourly_ts = self._hourly_timestamps(self.hourly_data)
+        self._daily_by_date = self._daily_sun_times(self.daily_data)
+
+        sections = (
+            self.hourly_data,
+            self.daily_data,
+            self._hourly_ts,
+            self._daily_by_date,
+        )
+        _remember_parsed_csv(cache_key, sections)
+        _save_parsed_csv(csv_path, csv_stat, sections)
         self._parsed = True
 
+    def _hourly_timestamps(self, rows):
+        """Unix timestamps of the hourly rows
+
+        Open-Meteo exports are a regular hourly grid, so when the last row is
+        exactly (rows - 1) hours after the first, the rest are computed
+        instead of parsed; otherwise every row's time is parsed.
+        """
+        if not rows:
+            return []
+
+        first_ts = self._parse_timestamp(rows[0]["time"])
+        last_ts = self._parse_timestamp(rows[-1]["time"])
+        if first_ts and last_ts == first_ts + (len(rows) - 1) * 3600:
+            return list(range(first_ts, last_ts + 1, 3600))
+
+        return [self._parse_timestamp(row["time"]) for row in rows]
+
+    def _daily_sun_times(self, rows):
+        """Map each daily row's date to its (sunrise, sunset) Unix timestamps
+
+        Parsed once here so get_data_at_timestamp looks its day up directly
+        instead of scanning and parsing the daily rows per call. The first
+        row wins if a date repeats; malformed rows are skipped.
+        """
+        sun_times = {}
+        for daily_row in rows:
+            try:
+                daily_date = datetime.fromisoformat(daily_row["time"]).date()
+                if daily_date not in sun_times:
+                    sun_times[daily_date] = (
+                        self._parse_timestamp(daily_row["sunrise (iso8601)"]),
+                        self._parse_timestamp(daily_row["sunset (iso8601)"]),
+                    )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return sun_times
+
     def _extract_location_from_filepath(self):
         """Extract location info from Open-Meteo filename pattern"""
         filename = os.path.basename(self.csv_filepath)
@@ -264,26 +525,29 @@ class OpenMeteoConverter:
             self.lon = -74.0
 
     def _get_weather_condition(self, wmo_code, is_day):
-        """Convert WMO weather code to OpenWeather format"""
-        try:
-            code = int(float(wmo_code))
-        except (ValueError, TypeError):
-            code = 0  # Default to clear sky
+        """Convert WMO weather code to OpenWeather format
 
-        weather_info = self.wmo_to_openweather.get(code, self.wmo_to_openweather[0])
+        Known codes return a shared prebuilt dict; don't modify it.
+        """
+        if type(wmo_code) is int:
+            # Already an int on the per-row path: no float round trip
+            code = wmo_code
+        else:
+            try:
+                code = int(float(wmo_code))
+            except (ValueError, TypeError):
+                code = 0  # Default to clear sky
 
-        return {
-            "id": code + 800,  # Offset to avoid conflicts with OpenWeather IDs
-            "main": weather_info["main"],
-            "description": weather_info["description"],
-            "icon": weather_info["icon_day"] if is_day else weather_info["icon_night"],
-        }
+        conditions = _CONDITIONS.get(code)
+        if conditions is not None:
+            return conditions[1] if is_day else conditions[0]
+
+        # Unknown code: clear sky, but keep the code in the id
+        return _build_condition(code, _WMO_TO_OPENWEATHER[0], is_day)
 
     def _parse_timestamp(self, time_str):
         """Convert Open-Meteo timestamp to Unix timestamp (treating as UTC)"""
         try:
-            from datetime import timezone
-
             # Handle both "2024-01-01T00:00" and "2024-01-01" formats
             if "T" in time_str:
                 dt = datetime.fromisoformat(time_str)
@@ -296,21 +560,25 @@ class OpenMeteoConverter:
             return 0
 
     def _safe_float(self, value, default=0.0):
-        """Safely convert string to float, handling NaN and empty values"""
+        """Safely convert string to float, handling NaN and empty values
+
+        Missing cells and non-string values (e.g. a row.get default) are
+        checked up front, so only malformed text goes through an exception.
+        """
+        if not isinstance(value, str) or value.lower() in _MISSING_VALUES:
+            return default
         try:
-            if value.lower() in ("nan", "", "null"):
-                return default
             return float(value)
-        except (ValueError, AttributeError):
+        except ValueError:
             return default
 
     def _safe_int(self, value, default=0):
         """Safely convert string to int, handling NaN and empty values"""
+        if not isinstance(value, str) or value.lower() in _MISSING_VALUES:
+            return default
         try:
-            if value.lower() in ("nan", "", "null"):
-                return default
             return int(float(value))
-        except (ValueError, AttributeError):
+        except ValueError:
             return default
 
     def find_closest_timestamp_index(self, target_timestamp):
@@ -320,20 +588,26 @@ class OpenMeteoConverter:
         if not self.hourly_data:
             return 0
 
-        best_index = 0
-        best_diff = float("inf")
-
-        for i, row in enumerate(self.hourly_data):
-            row_timestamp = self._parse_timestamp(row["time"])
-            diff = abs(row_timestamp - target_timestamp)
-            if diff < best_diff:
-                best_diff = diff
-                best_index = i
-
-        return best_index
-
-    def get_data_at_timestamp(self, base_timestamp, hours_count=40):
-        """Get weather data starting from closest timestamp to base_timestamp"""
+        # Rows are in time order: bisect, then pick the closer neighbour
+        # (the earlier one on a tie)
+        timestamps = self._hourly_ts
+        index = bisect_left(timestamps, target_timestamp)
+        if index == 0:
+            return 0
+        if index == len(timestamps):
+            return index - 1
+        before_diff = target_timestamp - timestamps[index - 1]
+        after_diff = timestamps[index] - target_timestamp
+        return index - 1 if before_diff <= after_diff else index
+
+    def iter_forecast_items(self, base_timestamp, hours_count=40):
+        """Yield OpenWeather-format forecast items starting closest to base_timestamp
+
+        Builds one item at a time, so callers that only scan the hours don't
+        hold the whole list; get_data_at_timestamp collects them into a list.
+        Each item's weather condition and "sys" dicts are shared between
+        items, so treat them as read-only.
+        """
         self._parse_csv()
 
         if not self.hourly_data:
@@ -341,27 +615,29 @@ class OpenMeteoConverter:
 
         # Find starting point
         start_index = self.find_closest_timestamp_index(base_timestamp)
-
-        # Get forecast items
-        forecast_items = []
         end_index = min(start_index + hours_count, len(self.hourly_data))
 
-        for i in range(start_index, end_index):
-            row = self.hourly_data[i]
-
-            timestamp = self._parse_timestamp(row["time"])
-            temp = self._safe_float(row["temperature_2m (°C)"])
-            feels_like = self._safe_float(row["apparent_temperature (°C)"])
-            humidity = self._safe_int(row["relative_humidity_2m (%)"])
-            wind_speed = self._safe_float(row["wind_speed_10m (km/h)"])
-            wind_gust = self._safe_float(row["wind_gusts_10m (km/h)"])
-            weather_code = self._safe_int(row["weather_code (wmo code)"])
-            is_day = self._safe_int(row["is_day ()"]) == 1
-            cloud_cover = self._safe_int(row["cloud_cover (%)"])
-            visibility = self._safe_float(row["visibility (m)"], 10000)
+        # Walk the rows and their timestamps together, with the condition
+        # lookup bound once, to trim per-hour overhead for long batch runs
+        get_condition = self._get_weather_condition
+        for row, timestamp in zip(
+            self.hourly_data[start_index:end_index],
+            self._hourly_ts[start_index:end_index],
+        ):
+            # Cells are numeric text or "nan"; _fast_float parses them without
+            # the per-cell method call, lower() and exception of _safe_float
+            temp = _fast_float(row[TEMPERATURE_COLUMN])
+            feels_like = _fast_float(row["apparent_temperature (°C)"])
+            humidity = int(_fast_float(row["relative_humidity_2m (%)"]))
+            wind_speed = _fast_float(row["wind_speed_10m (km/h)"])
+            wind_gust = _fast_float(row["wind_gusts_10m (km/h)"])
+            weather_code = int(_fast_float(row["weather_code (wmo code)"]))
+            is_day = int(_fast_float(row["is_day ()"])) == 1
+            cloud_cover = int(_fast_float(row["cloud_cover (%)"]))
+            visibility = _fast_float(row["visibility (m)"], 10000)
 
             # Convert weather condition
-            weather_condition = self._get_weather_condition(weather_code, is_day)
+            weather_condition = get_condition(weather_code, is_day)
 
             # Build forecast item in OpenWeather format
             item = {
@@ -386,18 +662,16 @@ class OpenMeteoConverter:
                     "gust": wind_gust / 3.6,  # Convert km/h to m/s
                 },
                 "visibility": int(visibility),
-                "sys": {"pod": "d" if is_day else "n"},
-                "dt_txt": datetime.fromtimestamp(timestamp).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
+                "sys": _SYS_DAY if is_day else _SYS_NIGHT,
+                "dt_txt": _format_dt_txt(timestamp),
             }
 
             # Add precipitation data and calculate probability
-            rain = self._safe_float(row["rain (mm)"])
-            snow = self._safe_float(row["snowfall (cm)"])
+            rain = _fast_float(row["rain (mm)"])
+            snow = _fast_float(row["snowfall (cm)"])
 
-            # Calculate precipitation probability based on amounts
-            pop = 0
+            # Calculate precipitation probability based on amounts; most hours
+            # are dry, so they skip straight to a zero pop
             if rain > 0 or snow > 0:
                 total_precip = rain + (snow * 10)  # Snow is more voluminous
                 if total_precip > 0.1:
@@ -405,50 +679,40 @@ class OpenMeteoConverter:
                 else:
                     pop = 0.2  # Light precipitation
 
-            item["pop"] = pop
+                item["pop"] = pop
+                if rain > 0:
+                    item["rain"] = {"3h": rain}
+                if snow > 0:
+                    item["snow"] = {"3h": snow}
+            else:
+                item["pop"] = 0
+
+            yield item
 
-            if rain > 0:
-                item["rain"] = {"3h": rain}
-            if snow > 0:
-                item["snow"] = {"3h": snow}
+    def get_data_at_timestamp(self, base_timestamp, hours_count=40):
+        """Get weather data starting from closest timestamp to base_timestamp"""
+        forecast_items = list(self.iter_forecast_items(base_timestamp, hours_count))
 
-            forecast_items.append(item)
+        # Local date of the first forecast item (today if there are none)
+        start_date = (
+            datetime.fromtimestamp(forecast_items[0]["dt"]).date()
+            if forecast_items
+            else datetime.now().date()
+        )
 
         # Get sunrise/sunset from daily data for the start date
         sunrise_ts = sunset_ts = None
         if self.daily_data and forecast_items:
-            start_date = datetime.fromtimestamp(forecast_items[0]["dt"]).date()
-
-            for daily_row in self.daily_data:
-                try:
-                    daily_date = datetime.fromisoformat(daily_row["time"]).date()
-                    if daily_date == start_date:
-                        sunrise_ts = self._parse_timestamp(
-                            daily_row["sunrise (iso8601)"]
-                        )
-                        sunset_ts = self._parse_timestamp(daily_row["sunset (iso8601)"])
-                        break
-                except:
-                    continue
+            sunrise_ts, sunset_ts = self._daily_by_date.get(start_date, (None, None))
 
-        # Default sunrise/sunset if not found (approximate NYC winter times)
+        # Default sunrise/sunset if not found (approximate NYC winter times),
+        # offset from the start date's midnight rather than rebuilding datetimes
         if not sunrise_ts or not sunset_ts:
-            start_dt = (
-                datetime.fromtimestamp(forecast_items[0]["dt"])
-                if forecast_items
-                else datetime.now()
-            )
-            start_date = start_dt.date()
-            sunrise_ts = int(
-                datetime.combine(start_date, datetime.min.time())
-                .replace(hour=7, minute=19)
-                .timestamp()
-            )
-            sunset_ts = int(
-                datetime.combine(start_date, datetime.min.time())
-                .replace(hour=17, minute=38)
-                .timestamp()
+            midnight_ts = int(
+                datetime.combine(start_date, datetime.min.time()).timestamp()
             )
+            sunrise_ts = midnight_ts + 7 * 3600 + 19 * 60
+            sunset_ts = midnight_ts + 17 * 3600 + 38 * 60
 
         # Build city data using detected location
         city_id = 5128581 if self.city_name == "New York" else 6167865  # Toronto
@@ -488,10 +752,7 @@ class OpenMeteoConverter:
         if not self.hourly_data:
             return None, None
 
-        first_ts = self._parse_timestamp(self.hourly_data[0]["time"])
-        last_ts = self._parse_timestamp(self.hourly_data[-1]["time"])
-
-        return first_ts, last_ts
+        return self._hourly_ts[0], self._hourly_ts[-1]
 
 
 # Global converter instances (initialized when first needed)
@@ -502,9 +763,6 @@ def get_converter(dataset=None):
     """Get or create converter instance for specified dataset"""
     global _converters
 
-    # Import centralized config
-    from csv_config import DEFAULT_DATASET, get_dataset_info
-
     if dataset is None:
         dataset = DEFAULT_DATASET
 
@@ -527,15 +785,14 @@ def get_converter(dataset=None):
 def generate_historical_weather_data(base_timestamp, dataset=None):
     """Generate weather data from historical CSV for given timestamp
 
-    This function integrates with the existing mock_weather_data.py system
+    Raises ValueError when the dataset's CSV could not be loaded
     """
     converter = get_converter(dataset)
     if not converter:
-        # Fallback to synthetic data if CSV not available
-        from mock_weather_data import MockWeatherGenerator
-
-        generator = MockWeatherGenerator(base_timestamp)
-        return generator.generate_mock_forecast("winter_clear")
+        # No synthetic fallback: mock_weather_data isn't part of the preview,
+        # and a failed import isn't cached, so every call would search
+        # sys.path again before failing
+        raise ValueError(f"Historical CSV data not available for dataset: {dataset}")
 
     # Generate weather data for the requested timestamp
     weather_data = converter.get_data_at_timestamp(base_timestamp)
@@ -575,18 +832,6 @@ def _store_yesterday_history(converter, current_timestamp):
         low_temp = min(temps)
 
         # Store in weather history using the same system as the narrative
-        import os
-        import sys
-
-        # Add CircuitPython path for weather_history import
-        circuitpy_path = os.path.join(
-            os.path.dirname(__file__), "..", "300x400", "CIRCUITPY"
-        )
-        if circuitpy_path not in sys.path:
-            sys.path.insert(0, circuitpy_path)
-
-        from weather_history import store_today_temperatures
-
         # Store yesterday's data as if it were "today" at that time
         store_today_temperatures(yesterday_timestamp, current_temp, high_temp, low_temp)
 
@@ -604,3 +849,17 @@ def get_historical_data_range(dataset="ny_2024"):
     if not converter:
         return None, None
     return converter.get_data_range()
+
+
+if __name__ == "__main__":
+    # Parse every dataset once ahead of time (python -m shared.open_meteo_converter
+    # from preview/), so server workers and batch runs all start from the
+    # saved copy in preview/.cache instead of each parsing the CSV
+    for dataset_name in DATASETS:
+        converter = get_converter(dataset_name)
+        if converter:
+            first_ts, last_ts = converter.get_data_range()
+            print(
+                f"  {dataset_name}: {len(converter.hourly_data)} hourly rows "
+                f"({first_ts} - {last_ts})"
+            )
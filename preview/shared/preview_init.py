@@ -87,17 +87,11 @@ class PreviewInitializer:
     def setup_filesystem(self):
         """Setup filesystem dependencies"""
         if not self.initialized:
-            # Import setup_filesystem from preview directory
-            setup_filesystem_path = self.preview_dir / "setup_filesystem.py"
-            if setup_filesystem_path.exists():
-                import importlib.util
-
-                spec = importlib.util.spec_from_file_location(
-                    "setup_filesystem", setup_filesystem_path
-                )
-                setup_filesystem_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(setup_filesystem_module)
-                setup_filesystem_module.setup_preview_filesystem()
+            # Regular import, so the module is executed once per process and
+            # then reused from sys.modules
+            from shared.setup_filesystem import setup_preview_filesystem
+
+            setup_preview_filesystem()
 
     def change_to_hardware_dir(self):
         """Change to hardware directory for font/resource loading"""
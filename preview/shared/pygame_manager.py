@@ -4,6 +4,7 @@ Based on proven minimal approach - keep it simple!
 """
 
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -18,6 +19,9 @@ os.environ["DISPLAYIO_NO_BACKGROUND"] = "1"
 import blinka_displayio_pygamedisplay
 import pygame
 
+# Markup tags like <h>, <i>, <b>, <red> (content between them is kept)
+_MARKUP_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class PersistentPygameDisplay:
     """Manages a single pygame display instance for batch processing"""
@@ -34,6 +38,7 @@ class PersistentPygameDisplay:
         # Performance optimization: cache text measurements and reuse renderer
         self._text_measurement_cache = {}
         self._text_renderer_instance = None
+        self._icon_bitmap_cache = {}  # filename -> OnDiskBitmap (None if missing)
         self.fast_mode = False  # Skip expensive text rendering when True
 
         self._setup_mocks()
@@ -82,13 +87,24 @@ class PersistentPygameDisplay:
         if not use_icons:
             return None
 
+        icon_cache = self._icon_bitmap_cache
+
         def load_icon(filename):
             try:
                 import displayio
 
-                file_path = self.icons_path / filename
-                if file_path.exists():
-                    pic = displayio.OnDiskBitmap(str(file_path))
+                # Decode each icon file once; every call still gets its own
+                # TileGrid since callers position it
+                if filename in icon_cache:
+                    pic = icon_cache[filename]
+                else:
+                    file_path = self.icons_path / filename
+                    pic = None
+                    if file_path.exists():
+                        pic = displayio.OnDiskBitmap(str(file_path))
+                    icon_cache[filename] = pic
+
+                if pic is not None:
                     return displayio.TileGrid(pic, pixel_shader=pic.pixel_shader)
             except:
                 pass
@@ -240,10 +256,9 @@ class PersistentPygameDisplay:
             # Convert wrapped lines to text with newlines
             wrapped_text_lines = []
             for line_segments in wrapped_lines:
-                line_text = ""
-                for text_content, style, color in line_segments:
-                    line_text += text_content
-                wrapped_text_lines.append(line_text)
+                wrapped_text_lines.append(
+                    "".join(text_content for text_content, _, _ in line_segments)
+                )
 
             wrapped_text = "\n".join(wrapped_text_lines)
 
@@ -285,10 +300,8 @@ class PersistentPygameDisplay:
 
     def _strip_markup_tags(self, text):
         """Remove markup tags like <h>, <i>, <b>, <red> from text"""
-        import re
-
         # Remove all markup tags but keep the content inside
-        cleaned = re.sub(r"<[^>]+>", "", text)
+        cleaned = _MARKUP_TAG_RE.sub("", text)
         return cleaned.strip()
 
     def clear_cache(self):
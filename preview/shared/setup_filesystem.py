@@ -7,16 +7,18 @@ from pathlib import Path
 
 from shared.filesystem import FileSystem as PreviewFileSystem
 
+# Hardware path for importing shared modules, added once at import rather
+# than on every setup call
+hardware_path = Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
+if str(hardware_path) not in sys.path:
+    sys.path.insert(0, str(hardware_path))
+
 
 def setup_preview_filesystem():
     """Setup filesystem dependencies for preview system"""
     # Create preview filesystem
     filesystem = PreviewFileSystem()
 
-    # Add hardware path for importing shared modules
-    hardware_path = Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
-    sys.path.insert(0, str(hardware_path))
-
     # Inject into shared modules
     from utils.logger import set_filesystem as set_logger_filesystem
     from weather.weather_history import set_filesystem as set_weather_history_filesystem
@@ -38,11 +40,6 @@ def set_hardware_silent_mode(silent=True):
         silent (bool): If True, suppress hardware module log output
     """
     try:
-        # Add hardware path for importing
-        hardware_path = Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
-        if str(hardware_path) not in sys.path:
-            sys.path.insert(0, str(hardware_path))
-
         # Set silent mode in hardware logger
         from utils.logger import set_silent_mode as set_hardware_silent_mode
 
@@ -9,38 +9,53 @@ import sys
 import tempfile
 from pathlib import Path
 
-import pygame
-from dotenv import load_dotenv
+# Standalone script run via `main.py test`; the test_* functions here hit live
+# APIs and need the setup below, so keep pytest from collecting them
+__test__ = False
 
-# Load environment variables from .env file
-load_dotenv()
+preview_dir = Path(__file__).parent.parent
+hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
 
-# Add preview directory to path
-preview_dir = Path(__file__).parent
-sys.path.insert(0, str(preview_dir))
+# Bound by _setup_environment() so importing this module has no side effects
+preview_config = None
+weather_api = None
+CachingHTTPClient = None
+WeatherImageRenderer = None
 
-# Import preview components and config
-import config as preview_config
-from caching_http_client import CachingHTTPClient
-from image_renderer import WeatherImageRenderer
-from setup_filesystem import setup_preview_filesystem
 
-# Add hardware path and mock config for weather_api
-hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
-sys.path.insert(0, str(hardware_path))
+def _setup_environment():
+    """Load .env, set up import paths and import the preview/hardware modules"""
+    global preview_config, weather_api, CachingHTTPClient, WeatherImageRenderer
 
-# Mock the hardware config module with our preview config
-sys.modules["config"] = preview_config
+    if weather_api is not None:
+        return
 
-# Change to hardware directory before importing display modules (for font loading)
-import os
+    from dotenv import load_dotenv
 
-original_cwd = os.getcwd()
-hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
-os.chdir(hardware_path)
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Add preview and hardware directories to path
+    if str(preview_dir) not in sys.path:
+        sys.path.insert(0, str(preview_dir))
+    if str(hardware_path) not in sys.path:
+        sys.path.insert(0, str(hardware_path))
 
-# Now import weather modules
-from weather import weather_api
+    # Importing the renderer also installs the preview config as the
+    # hardware "config" module
+    import shared.config as config_module
+    from shared.image_renderer import WeatherImageRenderer as renderer_class
+    from web.caching_http_client import CachingHTTPClient as client_class
+
+    # Change to hardware directory before importing display modules (for font loading)
+    os.chdir(hardware_path)
+
+    from weather import weather_api as weather_api_module
+
+    preview_config = config_module
+    CachingHTTPClient = client_class
+    WeatherImageRenderer = renderer_class
+    weather_api = weather_api_module
 
 
 def test_openweathermap_integration(renderer=None):
@@ -264,6 +279,8 @@ def main():
     print("🌤️  PinkWeather API Integration Test")
     print("=====================================")
 
+    _setup_environment()
+
     # Verify environment
     # Verify required config is loaded
     if not preview_config.OPENWEATHER_API_KEY:
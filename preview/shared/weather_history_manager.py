@@ -4,8 +4,18 @@ Handles both live API scenarios and bulk CSV processing
 """
 
 import json
+import sys
 from pathlib import Path
 
+hardware_path = Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
+if str(hardware_path) not in sys.path:
+    sys.path.insert(0, str(hardware_path))
+
+from weather.weather_history import (
+    generate_temperature_comparison,
+    set_history_data_source,
+)
+
 
 class CSVHistoryDataSource:
     """Data source for weather history using CSV data"""
@@ -41,8 +51,11 @@ class CSVHistoryDataSource:
         yesterday_timestamp = current_timestamp - 86400
         yesterday_data = None
 
+        # Context is oldest first, so stop once we're past the 1 hour window
         for h in historical_context:
             h_timestamp = h.get("timestamp", 0)
+            if h_timestamp >= yesterday_timestamp + 3600:
+                break
             if abs(h_timestamp - yesterday_timestamp) < 3600:  # Within 1 hour
                 yesterday_data = h
                 break
@@ -54,6 +67,8 @@ class CSVHistoryDataSource:
         current_temp = None
         for h in reversed(historical_context):
             h_timestamp = h.get("timestamp", 0)
+            if h_timestamp <= current_timestamp - 1800:
+                break  # Everything further back is older still
             time_diff = abs(h_timestamp - current_timestamp)
             if time_diff < 1800:  # Within 30 min
                 current_temp = h.get("temperature")
@@ -68,18 +83,7 @@ class CSVHistoryDataSource:
         if current_temp is not None:
             yesterday_temp = yesterday_data.get("temperature", 20)
 
-            # Import and use the existing comparison logic
-            import sys
-            from pathlib import Path
-
-            hardware_path = (
-                Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
-            )
-            if str(hardware_path) not in sys.path:
-                sys.path.insert(0, str(hardware_path))
-
-            from weather.weather_history import generate_temperature_comparison
-
+            # Use the existing comparison logic
             comparison = generate_temperature_comparison(current_temp, yesterday_temp)
 
             if comparison:
@@ -152,6 +156,8 @@ class WeatherHistoryManager:
             yesterday_temp = None
             for h in reversed(historical_context):
                 h_timestamp = h.get("timestamp", timestamp)
+                if h_timestamp <= timestamp - 86400 - 3600:
+                    break  # Newest first, so nothing earlier can match
                 if (
                     abs(h_timestamp - (timestamp - 86400)) < 3600
                 ):  # Within 1 hour of 24h ago
@@ -253,17 +259,6 @@ class WeatherHistoryManager:
     def setup_csv_history_data_source(self):
         """Set up the CSV data source for weather history in the hardware module"""
         if self.csv_data_source:
-            import sys
-            from pathlib import Path
-
-            hardware_path = (
-                Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
-            )
-            if str(hardware_path) not in sys.path:
-                sys.path.insert(0, str(hardware_path))
-
-            from weather.weather_history import set_history_data_source
-
             set_history_data_source(self.csv_data_source)
 
     def get_in_memory_comparison(self, current_timestamp):
@@ -7,12 +7,16 @@ import json
 import time
 from pathlib import Path
 
+from shared.logger import is_debug_mode, log_debug
+
 
 class APICache:
     """Simple file-based cache for API responses"""
 
     def __init__(self, cache_dir=".cache"):
-        self.cache_dir = Path(__file__).parent.parent / cache_dir
+        # Absolute path from this file, independent of the working directory
+        # (the preview renderer chdirs into the hardware tree while running)
+        self.cache_dir = (Path(__file__).parent.parent / cache_dir).resolve()
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_duration = 3600  # 1 hour in seconds
 
@@ -26,12 +30,13 @@ class APICache:
         cache_file = self.cache_dir / f"{cache_key}.json"
 
         if not cache_file.exists():
-            print(f"DEBUG CACHE: No cache file for {cache_key}")
+            log_debug(f"DEBUG CACHE: No cache file for {cache_key}")
             return None
 
         try:
-            with open(cache_file) as f:
-                cached_data = json.load(f)
+            # One binary read; json.loads decodes the UTF-8 bytes itself
+            with open(cache_file, "rb") as f:
+                cached_data = json.loads(f.read())
 
             cache_timestamp = cached_data["timestamp"]
             current_time = time.time()
@@ -41,15 +46,16 @@ class APICache:
             max_age = (
                 cache_duration if cache_duration is not None else self.cache_duration
             )
-            print(
-                f"DEBUG CACHE: Found cache for {cache_key}, age: {age_seconds:.1f}s (max: {max_age}s)"
-            )
+            if is_debug_mode():
+                log_debug(
+                    f"DEBUG CACHE: Found cache for {cache_key}, age: {age_seconds:.1f}s (max: {max_age}s)"
+                )
             if age_seconds < max_age:
-                print(f"DEBUG CACHE: Cache still valid, returning cached data")
+                log_debug("DEBUG CACHE: Cache still valid, returning cached data")
                 return cached_data.get("data")
             else:
                 # Cache expired
-                print(f"DEBUG CACHE: Cache expired, deleting file")
+                log_debug("DEBUG CACHE: Cache expired, deleting file")
                 cache_file.unlink()
                 return None
 
@@ -65,16 +71,19 @@ class APICache:
         cached_data = {"timestamp": cache_timestamp, "data": data}
 
         # Log custom cache duration if provided
-        duration_msg = (
-            f" (custom duration: {cache_duration}s)" if cache_duration else ""
-        )
-        print(
-            f"DEBUG CACHE: Caching data for {cache_key} at timestamp {cache_timestamp}{duration_msg}"
-        )
+        if is_debug_mode():
+            duration_msg = (
+                f" (custom duration: {cache_duration}s)" if cache_duration else ""
+            )
+            log_debug(
+                f"DEBUG CACHE: Caching data for {cache_key} at timestamp {cache_timestamp}{duration_msg}"
+            )
 
         try:
+            # Encode first, then write once (json.dump writes chunk by chunk)
+            content = json.dumps(cached_data, separators=(",", ":"))
             with open(cache_file, "w") as f:
-                json.dump(cached_data, f)
+                f.write(content)
         except Exception:
             pass  # Fail silently if can't cache
 
@@ -86,7 +95,7 @@ class APICache:
                 continue
             try:
                 cache_file.unlink()
-                print(f"DEBUG CACHE: Cleared cache file {cache_file.name}")
+                log_debug(f"DEBUG CACHE: Cleared cache file {cache_file.name}")
             except Exception:
                 pass
 
@@ -5,7 +5,9 @@ Caching HTTP client wrapper that combines requests with API cache
 import hashlib
 import time
 
-from .api_cache import APICache
+from shared.logger import log_debug
+
+from .api_cache import api_cache
 from .http_client import HTTPClient
 
 
@@ -14,7 +16,8 @@ class CachingHTTPClient:
 
     def __init__(self):
         self.http_client = HTTPClient()
-        self.cache = APICache()
+        # Share the module-level cache (its directory is resolved once at import)
+        self.cache = api_cache
 
     def get(self, url, cache_duration=None):
         """Make GET request with caching"""
@@ -27,17 +30,19 @@ class CachingHTTPClient:
         # Check cache first with custom duration if provided
         cached_response = self.cache.get(provider, lat, lon, cache_duration)
         if cached_response is not None:
-            print(f"DEBUG CACHE: Cache HIT for {provider} {lat},{lon}")
+            log_debug(f"DEBUG CACHE: Cache HIT for {provider} {lat},{lon}")
             return cached_response
 
-        print(f"DEBUG CACHE: Cache MISS for {provider} {lat},{lon} - making API call")
+        log_debug(
+            f"DEBUG CACHE: Cache MISS for {provider} {lat},{lon} - making API call"
+        )
 
         # Make the actual request
-        print(f"DEBUG CACHE: Making HTTP request to {url}")
+        log_debug(f"DEBUG CACHE: Making HTTP request to {url}")
         response = self.http_client.get(url)
 
         # Cache the response with custom duration if provided
-        print(f"DEBUG CACHE: Caching response for {provider} {lat},{lon}")
+        log_debug(f"DEBUG CACHE: Caching response for {provider} {lat},{lon}")
         self.cache.set(provider, lat, lon, response, cache_duration)
 
         return response
@@ -7,31 +7,82 @@ Focused on 400x300 display only (removed 250x122 legacy support)
 import json
 import os
 import sys
+import threading
 import time
 import traceback
+from collections import OrderedDict
 from datetime import datetime, timezone
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urlparse
 
 # Add paths for imports
 current_dir = Path(__file__).parent
 preview_dir = current_dir.parent
 sys.path.insert(0, str(preview_dir))
 
+import shared.config as preview_config
 from shared.data_loader import CSVWeatherLoader
-from shared.image_renderer import WeatherImageRenderer
+from shared.logger import is_debug_mode, log_debug
+
+# Importing the renderer puts the hardware path on sys.path and installs the
+# preview config as the hardware "config" module, so hardware imports follow it
+from shared.image_renderer import WeatherImageRenderer, render_weather_to_image
 from shared.weather_history_manager import WeatherHistoryManager
+from weather import weather_api
+from weather.weather_history import store_today_temperatures
 from web.api_cache import api_cache
+from web.caching_http_client import CachingHTTPClient
+from web.csv_config import DATASETS, get_csv_path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_TEMPLATE_PATH = current_dir / "templates" / "display.html"
+
+# Set RELOAD_TEMPLATES=1 to re-read display.html on every request while editing it
+_RELOAD_TEMPLATES = bool(os.getenv("RELOAD_TEMPLATES"))
+
+
+def _json_bytes(data):
+    """Serialize a JSON response body (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+# Number of rendered CSV scenario previews kept in memory
+_PREVIEW_CACHE_SIZE = 32
+
+# Prebuilt header blocks for the preview image (sent on every image GET)
+_NO_CACHE_HEADERS = (
+    b"Cache-Control: no-cache, no-store, must-revalidate\r\n"
+    b"Pragma: no-cache\r\n"
+    b"Expires: 0\r\n"
+)
+_NO_CACHE_PNG_HEADERS = b"Content-type: image/png\r\n" + _NO_CACHE_HEADERS
+_NO_CACHE_BMP_HEADERS = b"Content-type: image/bmp\r\n" + _NO_CACHE_HEADERS
 
 
 class WeatherPreviewHandler(BaseHTTPRequestHandler):
     """Enhanced HTTP request handler for weather preview functionality"""
 
+    # Every response sets Content-Length, so the page can keep one
+    # connection open for the POST and the image GET that follows it
+    protocol_version = "HTTP/1.1"
+
     # Class-level shared resources
     _image_renderer = None
     _csv_loaders = {}  # Cache CSV loaders by file path
-    _current_image_bytes = None  # Store current image for GET requests
+    _current_image = None  # RenderedImage for GET requests (set under _render_lock)
+    _template_bytes = None  # Encoded display.html, read on first GET
+    # Rendered CSV scenario previews keyed by image id, most recent last
+    _preview_cache = OrderedDict()
+    # Rendering changes the working directory and drives a single global
+    # pygame display, so only one request may render at a time
+    _render_lock = threading.Lock()
 
     def do_GET(self):
         """Handle GET requests"""
@@ -40,7 +91,11 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
         if parsed_url.path == "/" or parsed_url.path == "/display":
             self.serve_html_template()
         elif parsed_url.path == "/preview":
-            self.serve_current_preview()
+            self.serve_current_preview(self._image_format(parsed_url))
+        elif parsed_url.path.startswith("/preview/"):
+            self.serve_cached_preview(
+                parsed_url.path[len("/preview/") :], self._image_format(parsed_url)
+            )
         elif parsed_url.path == "/api/data-ranges":
             self.serve_csv_data_ranges()
         elif parsed_url.path == "/api/clear-cache":
@@ -53,50 +108,48 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
         if self.path == "/preview":
             self.handle_preview_generation()
         else:
+            # The request body is left unread, so don't reuse the connection
+            self.close_connection = True
             self.send_error(404, "Not found")
 
     def serve_html_template(self):
         """Serve the main HTML template"""
-        template_path = Path(__file__).parent / "templates" / "display.html"
-
         try:
-            with open(template_path, "r") as f:
-                content = f.read()
+            content = self._get_template_bytes()
 
             self.send_response(200)
             self.send_header("Content-type", "text/html")
+            self.send_header("Content-Length", str(len(content)))
             self.end_headers()
-            self.wfile.write(content.encode())
+            self.wfile.write(content)
 
         except FileNotFoundError:
             self.send_error(404, "Template not found")
         except Exception as e:
             self.send_error(500, f"Error loading template: {e}")
 
-    def serve_current_preview(self):
+    @staticmethod
+    def _image_format(parsed_url):
+        """Requested preview image format ("png" unless ?fmt=bmp)"""
+        if "fmt=" in parsed_url.query:
+            return dict(parse_qsl(parsed_url.query)).get("fmt", "png")
+        return "png"
+
+    def serve_current_preview(self, image_format="png"):
         """Serve current weather preview image (GET endpoint)"""
         try:
-            # Serve the current cached image bytes
-            if WeatherPreviewHandler._current_image_bytes:
-                self.send_response(200)
-                self.send_header("Content-type", "image/png")
-                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-                self.send_header("Pragma", "no-cache")
-                self.send_header("Expires", "0")
-                self.end_headers()
-                self.wfile.write(WeatherPreviewHandler._current_image_bytes)
-                return
-
-            # If no cached image, generate one with default settings
-            preview_data = self.generate_preview_from_live_api()
-            if preview_data and WeatherPreviewHandler._current_image_bytes:
-                self.send_response(200)
-                self.send_header("Content-type", "image/png")
-                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-                self.send_header("Pragma", "no-cache")
-                self.send_header("Expires", "0")
-                self.end_headers()
-                self.wfile.write(WeatherPreviewHandler._current_image_bytes)
+            image = WeatherPreviewHandler._current_image
+
+            if image is None:
+                # If no cached image, generate one with default settings.
+                # Check again under the lock so concurrent cold hits render once.
+                with WeatherPreviewHandler._render_lock:
+                    if WeatherPreviewHandler._current_image is None:
+                        self.generate_preview_from_live_api()
+                    image = WeatherPreviewHandler._current_image
+
+            if image:
+                self._send_image(image, image_format)
                 return
 
             self.send_error(500, "Failed to generate preview")
@@ -106,64 +159,83 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             traceback.print_exc()
             self.send_error(500, f"Preview generation error: {e}")
 
+    def serve_cached_preview(self, image_id, image_format="png"):
+        """Serve a specific rendered preview, falling back to the current one"""
+        cached = WeatherPreviewHandler._preview_cache.get(image_id)
+        if cached:
+            self._send_image(cached[0], image_format)
+        else:
+            self.serve_current_preview(image_format)
+
+    def _send_image(self, image, image_format="png"):
+        """Send a RenderedImage as PNG (or BMP for ?fmt=bmp) with no-cache headers"""
+        image_bytes = image.encode(image_format)
+        if image_format == "bmp":
+            headers = _NO_CACHE_BMP_HEADERS
+        else:
+            headers = _NO_CACHE_PNG_HEADERS
+
+        # Status line plus the standard Server/Date headers, then the
+        # prebuilt no-cache block in the same write as the Content-Length
+        self.send_response(200)
+        self.flush_headers()
+        self.wfile.write(headers + b"Content-Length: %d\r\n\r\n" % len(image_bytes))
+        # Write the cached image as-is rather than copying it into a new bytes
+        self.wfile.write(image_bytes)
+
     def serve_csv_data_ranges(self):
         """Serve available CSV data ranges for timestamp selection"""
         try:
+            # Loading a CSV resolves its path against the working directory
+            # and fills the shared loader cache, both of which a render may be
+            # using, so load under the render lock
             ranges = {}
+            with WeatherPreviewHandler._render_lock:
+                for dataset in DATASETS:
+                    data_range = self._get_dataset_range(dataset)
+                    if data_range:
+                        ranges[dataset] = data_range
 
-            # Check for common CSV files
-            datasets_dir = preview_dir.parent / "datasets"
-            if datasets_dir.exists():
-                for csv_file in datasets_dir.glob("*.csv"):
-                    try:
-                        loader = self._get_csv_loader(csv_file)
-                        records = loader.get_records(
-                            limit=10
-                        )  # Get a few records to determine range
-
-                        if records:
-                            first_timestamp = int(records[0]["timestamp"])
-                            last_record = loader.get_records(
-                                limit=1, offset=-1
-                            )  # Get last record
-                            if last_record:
-                                last_timestamp = int(last_record[0]["timestamp"])
-                            else:
-                                last_timestamp = first_timestamp
-
-                            # Create human readable name
-                            name = csv_file.stem
-                            if "nyc" in name.lower() or "40.65N73.98W" in name:
-                                display_name = "New York City"
-                            elif "toronto" in name.lower() or "43.70N79.40W" in name:
-                                display_name = "Toronto"
-                            else:
-                                display_name = name.replace("-", " ").title()
-
-                            ranges[str(csv_file)] = {
-                                "name": display_name,
-                                "start": first_timestamp,
-                                "end": last_timestamp,
-                                "start_date": datetime.fromtimestamp(
-                                    first_timestamp, tz=timezone.utc
-                                ).strftime("%Y-%m-%d %H:%M UTC"),
-                                "end_date": datetime.fromtimestamp(
-                                    last_timestamp, tz=timezone.utc
-                                ).strftime("%Y-%m-%d %H:%M UTC"),
-                            }
-                    except Exception as e:
-                        print(f"Error processing CSV {csv_file}: {e}")
-                        continue
+            response = {"success": True, "ranges": ranges}
 
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(ranges).encode())
+            self._send_json(response)
 
         except Exception as e:
             print(f"Error serving data ranges: {e}")
             self.send_error(500, f"Data ranges error: {e}")
 
+    def _send_json(self, data, status=200):
+        """Send a JSON response with an explicit Content-Length"""
+        body = _json_bytes(data)
+        self.send_response(status)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _get_dataset_range(self, dataset):
+        """Get the timestamp range for one dataset, or None if unavailable"""
+        try:
+            loader = self._get_csv_loader(get_csv_path(dataset))
+            first_timestamp, last_timestamp = loader.converter.get_data_range()
+            if first_timestamp is None:
+                return None
+
+            return {
+                "name": DATASETS[dataset]["name"],
+                "start": first_timestamp,
+                "end": last_timestamp,
+                "start_date": datetime.fromtimestamp(
+                    first_timestamp, tz=timezone.utc
+                ).strftime("%Y-%m-%d %H:%M UTC"),
+                "end_date": datetime.fromtimestamp(
+                    last_timestamp, tz=timezone.utc
+                ).strftime("%Y-%m-%d %H:%M UTC"),
+            }
+        except Exception as e:
+            print(f"Error processing dataset {dataset}: {e}")
+            return None
+
     def clear_api_cache(self):
         """Clear API response cache"""
         try:
@@ -171,10 +243,7 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
 
             response = {"status": "success", "message": "API cache cleared"}
 
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(response)
 
         except Exception as e:
             print(f"Error clearing cache: {e}")
@@ -189,31 +258,40 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             if content_length > 0:
                 post_data = self.rfile.read(content_length)
 
-            # Parse form data
-            form_data = parse_qs(post_data.decode("utf-8"))
-            print(f"Server received form data: {form_data}")
+            # Parse form data into a flat dict. Blank fields are dropped so
+            # their defaults apply, and the first of repeated fields wins
+            # (both as with parse_qs()[0])
+            form_data = {}
+            for key, value in parse_qsl(post_data.decode("utf-8", "replace")):
+                form_data.setdefault(key, value)
+            if is_debug_mode():
+                log_debug(f"Server received form data: {form_data}")
 
             # Extract parameters using existing form structure
             use_mock_weather = "use_mock_weather" in form_data
-            api_source = form_data.get("api_source", ["openweathermap"])[0]
-            mock_scenario = form_data.get("mock_scenario", ["ny_2024"])[0]
-            mock_timestamp = form_data.get("mock_timestamp", [""])[0]
+            api_source = form_data.get("api_source", "openweathermap")
+            mock_scenario = form_data.get("mock_scenario", "ny_2024")
+            mock_timestamp = form_data.get("mock_timestamp", "")
 
             # Generate preview based on use_mock_weather checkbox
-            if use_mock_weather and mock_timestamp:
-                # Use historical CSV data
-                preview_data = self.generate_preview_from_csv_scenario(
-                    mock_scenario, mock_timestamp
-                )
-            else:
-                # Use live API data
-                preview_data = self.generate_preview_from_live_api(api_source)
+            with WeatherPreviewHandler._render_lock:
+                if use_mock_weather and mock_timestamp:
+                    # Use historical CSV data
+                    preview_data = self.generate_preview_from_csv_scenario(
+                        mock_scenario, mock_timestamp
+                    )
+                else:
+                    # Use live API data
+                    preview_data = self.generate_preview_from_live_api(api_source)
 
             if preview_data:
                 # Format response to match expected JavaScript format
                 response_data = {
                     "success": True,
-                    "image_url": "/preview",  # JavaScript will fetch image from GET /preview
+                    # JavaScript will fetch image from GET /preview (or its cached copy)
+                    "image_url": f"/preview/{preview_data['image_id']}"
+                    if preview_data.get("image_id")
+                    else "/preview",
                     "display_type": "400x300",
                     "text_content": preview_data.get("narrative", ""),
                     "weather_desc": preview_data.get("weather_desc", ""),
@@ -222,19 +300,13 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
                     "timestamp": preview_data.get("timestamp", int(time.time())),
                 }
 
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps(response_data).encode())
+                self._send_json(response_data)
             else:
                 error_response = {
                     "success": False,
                     "error": "Failed to generate preview",
                 }
-                self.send_response(500)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps(error_response).encode())
+                self._send_json(error_response, 500)
 
         except Exception as e:
             print(f"Error handling preview generation: {e}")
@@ -246,15 +318,12 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
                 "timestamp": int(time.time()),
             }
 
-            self.send_response(500)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode())
+            self._send_json(error_response, 500)
 
     def generate_preview_from_live_api(self, api_source="openweathermap"):
         """Generate preview using live weather API"""
         try:
-            print(f"Generating preview from live {api_source} API")
+            log_debug(f"Generating preview from live {api_source} API")
 
             # Get image renderer
             renderer = self._get_image_renderer()
@@ -272,18 +341,7 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             low_temp = weather_data.get("low_temp", current_temp)
 
             if current_temp is not None:
-                # Import and call hardware storage function
-                import sys
-                from pathlib import Path
-
-                hardware_path = (
-                    Path(__file__).parent.parent.parent / "300x400" / "CIRCUITPY"
-                )
-                if str(hardware_path) not in sys.path:
-                    sys.path.insert(0, str(hardware_path))
-
-                from weather.weather_history import store_today_temperatures
-
+                # Call hardware storage function
                 store_today_temperatures(
                     current_timestamp, current_temp, high_temp, low_temp
                 )
@@ -291,18 +349,16 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
                 #     f"DEBUG: Stored today's temps in live mode: {current_temp}°C (success: {success})"
                 # )
 
-            # Render to bytes using shared rendering
-            from shared.image_renderer import render_weather_to_bytes
-
-            image_bytes = render_weather_to_bytes(
+            # Render using shared rendering (encoded when the image is fetched)
+            image = render_weather_to_image(
                 weather_data, use_icons=True, indoor_temp_humidity="20°69%"
             )
 
-            if not image_bytes:
+            if not image:
                 raise ValueError("Failed to render weather image")
 
             # Store image bytes for GET /preview endpoint
-            WeatherPreviewHandler._current_image_bytes = image_bytes
+            WeatherPreviewHandler._current_image = image
 
             return {
                 "status": "success",
@@ -314,6 +370,10 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
                 "narrative": self._extract_narrative_from_weather_data(weather_data),
             }
 
+        except ValueError as e:
+            # Fetch/render failures already reported where they happened
+            print(f"Error generating live preview: {e}")
+            return None
         except Exception as e:
             print(f"Error generating live preview: {e}")
             traceback.print_exc()
@@ -322,7 +382,7 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
     def generate_preview_from_csv_scenario(self, mock_scenario, timestamp_str):
         """Generate preview from historical CSV data using mock scenario"""
         try:
-            print(
+            log_debug(
                 f"Generating preview from scenario: {mock_scenario} at timestamp: {timestamp_str}"
             )
 
@@ -331,6 +391,14 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
 
             timestamp = int(timestamp_str)
 
+            # Same scenario and timestamp always render the same image
+            image_id = f"{mock_scenario}-{timestamp}"
+            cached = WeatherPreviewHandler._preview_cache.get(image_id)
+            if cached:
+                WeatherPreviewHandler._preview_cache.move_to_end(image_id)
+                WeatherPreviewHandler._current_image = cached[0]
+                return cached[1]
+
             # Map CSV scenarios to files
             scenario_to_csv = {
                 "ny_2024": "open-meteo-40.65N73.98W25m.csv",
@@ -366,6 +434,18 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             if not record:
                 raise ValueError(f"No data found for timestamp {timestamp}")
 
+            # Nearby timestamps resolve to the same hourly record, so render
+            # (and cache) the record's own timestamp once for all of them
+            requested_image_id = image_id
+            timestamp = int(record["timestamp"])
+            image_id = f"{mock_scenario}-{timestamp}"
+            cached = WeatherPreviewHandler._preview_cache.get(image_id)
+            if cached:
+                self._cache_preview(requested_image_id, cached)
+                WeatherPreviewHandler._preview_cache.move_to_end(image_id)
+                WeatherPreviewHandler._current_image = cached[0]
+                return cached[1]
+
             # Transform record to weather data format with historical context
             weather_data = loader.transform_record(record, include_history=True)
 
@@ -388,14 +468,12 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             # Get image renderer
             renderer = self._get_image_renderer()
 
-            # Render to bytes using shared rendering
-            from shared.image_renderer import render_weather_to_bytes
-
-            image_bytes = render_weather_to_bytes(
+            # Render using shared rendering (encoded when the image is fetched)
+            image = render_weather_to_image(
                 weather_data, use_icons=True, indoor_temp_humidity="20°69%"
             )
 
-            if not image_bytes:
+            if not image:
                 raise ValueError("Failed to render weather image")
 
             # Format human-readable date
@@ -403,24 +481,52 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             readable_date = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
 
             # Store image bytes for GET /preview endpoint
-            WeatherPreviewHandler._current_image_bytes = image_bytes
+            WeatherPreviewHandler._current_image = image
 
-            return {
+            preview_data = {
                 "status": "success",
                 "timestamp": timestamp,
                 "date": readable_date,
                 "weather_desc": weather_data.get("weather_desc", "Unknown"),
                 "data_source": "csv",
                 "mock_scenario": mock_scenario,
+                "image_id": image_id,
                 "current_temp": weather_data.get("current_temp"),
                 "narrative": self._extract_narrative_from_weather_data(weather_data),
             }
 
+            self._cache_preview(requested_image_id, (image, preview_data))
+            self._cache_preview(image_id, (image, preview_data))
+
+            return preview_data
+
+        except (ValueError, FileNotFoundError) as e:
+            # Bad scenario/timestamp or missing CSV: the message says it all
+            print(f"Error generating CSV preview: {e}")
+            return None
         except Exception as e:
             print(f"Error generating CSV preview: {e}")
             traceback.print_exc()
             return None
 
+    @staticmethod
+    def _cache_preview(image_id, entry):
+        """Store a (RenderedImage, preview data) entry, evicting the oldest"""
+        preview_cache = WeatherPreviewHandler._preview_cache
+        preview_cache[image_id] = entry
+        preview_cache.move_to_end(image_id)
+        while len(preview_cache) > _PREVIEW_CACHE_SIZE:
+            preview_cache.popitem(last=False)
+
+    def _get_template_bytes(self):
+        """Get encoded HTML template, read once unless RELOAD_TEMPLATES is set"""
+        if _RELOAD_TEMPLATES:
+            return _TEMPLATE_PATH.read_bytes()
+
+        if WeatherPreviewHandler._template_bytes is None:
+            WeatherPreviewHandler._template_bytes = _TEMPLATE_PATH.read_bytes()
+        return WeatherPreviewHandler._template_bytes
+
     def _get_image_renderer(self):
         """Get or create shared image renderer"""
         if not WeatherPreviewHandler._image_renderer:
@@ -430,7 +536,7 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
     def _get_csv_loader(self, csv_path):
         """Get or create CSV loader with caching"""
         csv_path = Path(csv_path)
-        cache_key = str(csv_path.absolute())
+        cache_key = str(csv_path.resolve())
 
         if cache_key not in WeatherPreviewHandler._csv_loaders:
             if not csv_path.exists():
@@ -443,16 +549,13 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
     def _get_live_weather_data(self, api_source="openweathermap"):
         """Get weather data from live API using shared config and hardware modules"""
         try:
-            # Use shared config
-            import shared.config as preview_config
-            from web.caching_http_client import CachingHTTPClient
-
-            # DEBUG: Print config values
-            print(
-                f"DEBUG: TIMEZONE_OFFSET_HOURS = {preview_config.TIMEZONE_OFFSET_HOURS}"
-            )
-            print(f"DEBUG: LATITUDE = {preview_config.LATITUDE}")
-            print(f"DEBUG: LONGITUDE = {preview_config.LONGITUDE}")
+            # DEBUG: Print config values (PINKWEATHER_DEBUG=1)
+            if is_debug_mode():
+                log_debug(
+                    f"DEBUG: TIMEZONE_OFFSET_HOURS = {preview_config.TIMEZONE_OFFSET_HOURS}"
+                )
+                log_debug(f"DEBUG: LATITUDE = {preview_config.LATITUDE}")
+                log_debug(f"DEBUG: LONGITUDE = {preview_config.LONGITUDE}")
 
             # Verify we have necessary config
             if (
@@ -487,42 +590,30 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
                     }
                 )
 
-            # Use hardware weather_api with our HTTP client
-            hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
-            if str(hardware_path) not in sys.path:
-                sys.path.insert(0, str(hardware_path))
-
-            # Mock the hardware config module
-            sys.modules["config"] = preview_config
-
-            from weather import weather_api
-
-            # Fetch weather data same as hardware
+            # Fetch weather data same as hardware (hardware weather_api with our HTTP client)
             forecast_data = weather_api.fetch_weather_data(WEATHER_CONFIG, http_client)
             if forecast_data:
                 weather_data = weather_api.get_display_variables(forecast_data)
 
-                # DEBUG: Print timestamp info
-                if weather_data:
+                # DEBUG: Print timestamp info (PINKWEATHER_DEBUG=1)
+                if weather_data and is_debug_mode():
                     current_ts = weather_data.get("current_timestamp")
-                    import time
-
                     current_time = time.time()
-                    print(
+                    log_debug(
                         f"DEBUG: Current system time = {current_time} ({time.ctime(current_time)})"
                     )
-                    print(f"DEBUG: Weather API returned timestamp = {current_ts}")
+                    log_debug(f"DEBUG: Weather API returned timestamp = {current_ts}")
                     if current_ts:
-                        print(
+                        log_debug(
                             f"DEBUG: Weather timestamp as date = {time.ctime(current_ts)}"
                         )
-                        print(
+                        log_debug(
                             f"DEBUG: Date components = {weather_data.get('day_name')} {weather_data.get('day_num')} {weather_data.get('month_name')}"
                         )
 
                     # DEBUG: Print forecast intervals
                     forecast_items = weather_data.get("forecast_data", [])
-                    print(f"DEBUG: Forecast has {len(forecast_items)} items:")
+                    log_debug(f"DEBUG: Forecast has {len(forecast_items)} items:")
                     for i, item in enumerate(forecast_items[:8]):  # First 8 items
                         dt = item.get("dt", 0)
                         temp = item.get("temp", "?")
@@ -541,7 +632,7 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
                                 f" [SPECIAL: {item.get('special_type', 'unknown')}]"
                             )
 
-                        print(
+                        log_debug(
                             f"DEBUG:   [{i}] {hour:02d}:00 - {temp}° {desc}{marker} (ts: {dt})"
                         )
 
@@ -549,6 +640,10 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
             else:
                 return None
 
+        except ValueError as e:
+            # Expected configuration problems (e.g. missing API key)
+            print(f"Error fetching weather data from {api_source}: {e}")
+            return None
         except Exception as e:
             print(f"Error fetching weather data from {api_source}: {e}")
             traceback.print_exc()
@@ -557,14 +652,8 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
     def _extract_narrative_from_weather_data(self, weather_data):
         """Extract narrative text from weather data using shared renderer"""
         try:
-            # Use the shared renderer to generate narrative
-            renderer = self._get_image_renderer()
-
-            # Generate narrative using the same method as batch processing
-            hardware_path = preview_dir.parent / "300x400" / "CIRCUITPY"
-            if str(hardware_path) not in sys.path:
-                sys.path.insert(0, str(hardware_path))
-
+            # Generate narrative using the same method as batch processing.
+            # Imported lazily: weather_display loads its fonts at import time.
             from display.weather_display import generate_weather_narrative
 
             narrative = generate_weather_narrative(weather_data)
@@ -584,7 +673,9 @@ class WeatherPreviewHandler(BaseHTTPRequestHandler):
 def run_server(port=8000, host="127.0.0.1"):
     """Run the preview HTTP server"""
     server_address = (host, port)
-    httpd = HTTPServer(server_address, WeatherPreviewHandler)
+    httpd = ThreadingHTTPServer(server_address, WeatherPreviewHandler)
+    # Don't let Ctrl+C wait on in-flight requests (e.g. a slow weather API call)
+    httpd.daemon_threads = True
 
     print(f"🌐 PinkWeather Preview Server starting on http://{host}:{port}")
     print("📡 Available endpoints:")
@@ -604,10 +695,11 @@ def run_server(port=8000, host="127.0.0.1"):
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Shutting down preview server...")
-        httpd.shutdown()
     except Exception as e:
         print(f"💥 Server error: {e}")
         traceback.print_exc()
+    finally:
+        httpd.server_close()
 
 
 def main():